@@ -25,7 +25,75 @@ OP_SYMBOL_MAP = {
 
 LOG_OPEN_HEADER_SEPARATORS = "="*40
 LOG_HEADER_SEPARATORS_LINE = "="*114
-REDUCIBLE_DEGREES = [2, 3]
+# memory cap for a field's discrete log tables - it also bounds their build
+# time (fields of up to 2^18 elements, built in well under a second)
+LOG_TABLES_MAX_BYTES = 2 * 2**20
+# fields of at least this degree invert elements with Itoh-Tsujii
+# (smaller ones use the extended Euclidean algorithm)
+ITOH_TSUJII_MIN_DEGREE = 8
+# powers a^e with e written in base p combine the Frobenius images
+# a^(p^j) in groups of this many (2^w - 1 products per group)
+FROBENIUS_POW_WINDOW = 4
+# fields up to this order are scanned for a generator in lexicographic order
+# when no seed is given (larger ones are sampled at random)
+GENERATOR_SCAN_MAX_ORDER = 2**20
+# number of BSGS giant steps computed and looked up per vectorized block
+BSGS_GIANT_STEPS_BLOCK = 1024
+# BSGS baby-step tables: number of tables kept in memory, the minimal size
+# of a table that is also saved to disk, and where (memory-mapped on reuse)
+BSGS_TABLE_CACHE_ENTRIES = 32
+BSGS_TABLE_PERSIST_MIN_SIZE = 2**16
+BSGS_TABLE_CACHE_DIR = "./.cache/bsgs"
+# largest default baby-step table of a batched BSGS (discrete_log_bsgs_many)
+BSGS_MANY_MAX_TABLE_SIZE = 2**22
+# Pollard rho: number of multipliers of the r-adding walk, number of walks
+# before giving up, and the maximal number of candidate logs checked per
+# collision (more means a large gcd with q-1 - a new walk is started)
+POLLARD_RHO_PARTITIONS = 20
+POLLARD_RHO_MAX_WALKS = 64
+POLLARD_RHO_MAX_SOLUTIONS = 1024
+# parallel rho: with W workers a distinguished point is about
+# sqrt(q)/(W*2^DP_BITS_MARGIN) steps away, workers drop walks longer than
+# MAX_WALK_FACTOR times the expected length, the search stops after
+# MAX_STEPS_FACTOR*sqrt(q) steps, and progress is logged every
+# PARALLEL_RHO_PROGRESS_SECONDS
+PARALLEL_RHO_DP_BITS_MARGIN = 4
+PARALLEL_RHO_MAX_WALK_FACTOR = 20
+PARALLEL_RHO_MAX_STEPS_FACTOR = 64
+PARALLEL_RHO_PROGRESS_SECONDS = 5
+# kangaroo: the number of jump sizes, the tame kangaroo's number of jumps
+# (times the mean jump, about sqrt(b-a)/2) and the number of attempts with
+# new jump sizes before giving up
+KANGAROO_JUMPS = 16
+KANGAROO_TAME_JUMPS_FACTOR = 4
+KANGAROO_MAX_ATTEMPTS = 8
+# fixed-base powers: the largest window (bits of the exponent per table
+# row) and the memory cap of the tables - the window is lowered to fit
+FIXED_BASE_MAX_WINDOW = 8
+FIXED_BASE_MAX_BYTES = 64 * 2**20
+# vectorized modular arithmetic stays in int64 below these moduli (values
+# up to m, and products of two residues, respectively) - object arrays of
+# Python ints are used above them
+INT64_SAFE_MODULUS = 2**62
+INT64_SAFE_MUL_MODULUS = 2**31
+# Pohlig-Hellman solves prime order subgroups up to this order with BSGS
+# (larger ones with Pollard rho, to keep the memory bounded)
+POHLIG_HELLMAN_BSGS_MAX_ORDER = 2**40
+# discrete logs mod p are found by a linear scan up to this p
+# (larger primes use Pohlig-Hellman with BSGS)
+DISCRETE_LOG_SCAN_MAX_P = 2**10
+# index calculus: the factor base holds the primes up to
+# exp(c*sqrt(ln p * ln ln p)) (at least INDEX_CALCULUS_MIN_BOUND), logs
+# modulo prime factors of p-1 up to INDEX_CALCULUS_SMALL_PRIME_MAX are
+# found with Pohlig-Hellman, and relations beyond the factor base size
+# are collected until INDEX_CALCULUS_MIN_SOLVED of its logs are known
+# (in up to INDEX_CALCULUS_MAX_ROUNDS rounds)
+INDEX_CALCULUS_BOUND_EXPONENT = 0.5**0.5
+INDEX_CALCULUS_MIN_BOUND = 100
+INDEX_CALCULUS_SMALL_PRIME_MAX = 2**24
+INDEX_CALCULUS_EXTRA_RELATIONS = 20
+INDEX_CALCULUS_MAX_ROUNDS = 8
+INDEX_CALCULUS_MIN_SOLVED = 0.9
 
 INVALID_ENUM_CREATION_MSG = "Tried to create {obj} instance with invalid " \
     + "`prompting_mode` value: {arg}"
@@ -1,3 +1,4 @@
 from .abstract_field_element import AbstractFieldElement
 from .finite_field_element import FiniteFieldElement
-from .prime_field_element import PrimeFieldElement
\ No newline at end of file
+from .prime_field_element import PrimeFieldElement
+from .finite_field_element_array import FiniteFieldElementArray
\ No newline at end of file
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Any
-from copy import deepcopy
+from copy import copy
 
 
 class AbstractFieldElement(ABC):
+    # elements are created in tight loops (every operation result) - slots
+    # keep them small and skip the per-instance '__dict__'
+    __slots__ = ("_p", "_a", "_a_orig")
 
     @abstractmethod
     def get_multiplicative_identity(self) -> "AbstractFieldElement":
@@ -37,6 +40,14 @@ class AbstractFieldElement(ABC):
     def a_orig(self) -> Any:
         return self._a_orig
 
+    def copy(self) -> "AbstractFieldElement":
+        """
+        Returns a shallow copy of the element. The value is shared - this is
+        safe, as in-place operators only write to a buffer that the element
+        owns and has not handed out.
+        """
+        return copy(self)
+
     def type_check(
         self,
         other: Any,
@@ -63,8 +74,9 @@ class AbstractFieldElement(ABC):
         * If an error occurs during calculation, such as attempting to compute  
           the exponentiation of zero, the function returns None and logs an internal error.
         """
-        # using deepcopy to ensure original object remains unchanged
-        element = deepcopy(self)
+        # the base is squared in place ('*=') - on a copy, so the original
+        # object remains unchanged
+        element = self.copy()
         result = self.get_multiplicative_identity()
 
         if n == 0:
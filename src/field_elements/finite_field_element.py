@@ -1,13 +1,12 @@
 from src.field_elements import AbstractFieldElement
+from src.fields.operations import kernels, poly_helper
 from common.entities import PrintMode
 from src.fields import FiniteField
 
 import common.log.logging_handler as log
 
 from typing import List, Union, Optional
-from copy import deepcopy
 
-import galois
 import numpy as np
 
 
@@ -22,10 +21,22 @@ class FiniteFieldElement(AbstractFieldElement):
     respect the field properties.
 
     Features:
-    - Represents finite field elements using matrix embeddings to capture the field structure.
-    - Supports arithmetic operations based on matrix representations of elements.
-    - Handles element inversion and division, including error handling for division by zero.
+    - Represents finite field elements using matrix embeddings to capture the field structure
+      (the matrix is a lazily computed view - it is only built when accessed).
+    - Supports arithmetic operations based on the coefficient vectors of elements
+      (polynomial product reduced mod f(x), see 'FiniteField.mul_vectors').
+    - Handles element inversion and division, including error handling for division by zero
+      (inversion is done over F_p - see 'FiniteField.inv_vectors' - and division is
+      a single inversion followed by a multiplication).
     - Supports exponentiation through efficient matrix exponentiation.
+    - In-place operators ('+=', '-=', '*=') write the result to a coefficient
+      buffer owned by the element, so loops of in-place operations allocate
+      no new elements or vectors. Values are otherwise shared, never copied
+      (see 'copy').
+    - Uses the field's discrete log tables (when the field is small enough)
+      for O(1) division and inversion, and for multiplicative orders.
+      Multiplication and powering always run on the coefficient vectors,
+      which is as fast as the table lookups.
     - Computes the multiplicative order of an element.
     - Provides utility methods for pretty-printing elements in various formats (vector, polynomial, matrix).
     - Supports finding a generator (primitive element) of the finite field.
@@ -39,6 +50,8 @@ class FiniteFieldElement(AbstractFieldElement):
         a_matrix (np.ndarray): The matrix representation of the element.
         field (FiniteField): The finite field associated with this element.
     """
+    __slots__ = ("_field", "_fx", "_n", "_a_matrix", "_code", "_scratch")
+
     def __init__(
         self,
         a: Union[np.ndarray, List[int]],
@@ -50,20 +63,21 @@ class FiniteFieldElement(AbstractFieldElement):
         # irreducible polynomia
         self._fx = (
             fx if isinstance(fx, np.ndarray)
-            else np.array(fx)
+            else np.array(fx, dtype=poly_helper.coefficient_dtype(p))
         )
         
         # polynomia degree
         self._n = len(fx) - 1
         self._a_orig = a
 
-        # number of elements in 'a' can't be greater than len(fx)
-        if len(a) > len(fx):
+        # number of elements in 'a' can't be greater than the degree of fx
+        if len(a) > self._n:
             raise ValueError(
                 f"Got {len(a)} coefficients for a field of degree {self._n}"
             )
 
-        a_arr = np.array(a) if not isinstance(a, np.ndarray) else a
+        # int64 coefficients, or python ints for large primes
+        a_arr = np.array(a, dtype=poly_helper.coefficient_dtype(p))
         a_mod = np.mod(a_arr, self._p)
         # number of elements 'a' can be less than len(fx)
         # in that case - we need to pad 'a'
@@ -72,8 +86,9 @@ class FiniteFieldElement(AbstractFieldElement):
         self._a = a_mod
 
         try:
-            # reducible field would raise an error
-            self._field = FiniteField(self._p, self._fx)
+            # reducible field would raise an error.
+            # fields are interned - validation runs only once per (p, fx)
+            self._field = FiniteField.get(self._p, self._fx)
         except Exception as e:
             # raising a more accurate error
             raise ValueError(
@@ -81,7 +96,73 @@ class FiniteFieldElement(AbstractFieldElement):
                 f"creation error:\n{e}"
             )
 
-        self._a_matrix = self.element_embedding_GLn(self._a)   
+        # share the field's read-only polynomial
+        self._fx = self._field.fx
+        # matrix representation - built on first access (see 'a_matrix')
+        self._a_matrix = None
+        # integer code of the element (see 'FiniteField.encode'),
+        # computed on first use
+        self._code = None
+        # coefficient buffer of the in-place operators, allocated on first use
+        self._scratch = None
+
+    @classmethod
+    def _from_field(
+        cls,
+        a: np.ndarray,
+        field: FiniteField
+    ) -> "FiniteFieldElement":
+        """
+        Creates an element of an existing field from coefficients that are
+        already reduced mod p and of length n.
+        Used for operation results - skips the input validation and the
+        field lookup done in '__init__'.
+        """
+        element = cls.__new__(cls)
+        AbstractFieldElement.__init__(element, field.p)
+        element._field = field
+        element._fx = field.fx
+        element._n = field.n
+        element._a = a
+        element._a_orig = a
+        element._a_matrix = None
+        element._code = None
+        element._scratch = None
+        return element
+
+    def _from_code(self, code: int) -> "FiniteFieldElement":
+        """Creates an element of this element's field from its code."""
+        element = FiniteFieldElement._from_field(
+            self._field.decode(code), self._field
+        )
+        element._code = code
+        return element
+
+    def _get_code(self) -> int:
+        if self._code is None:
+            self._code = self._field.encode(self._a)
+        return self._code
+
+    def copy(self) -> "FiniteFieldElement":
+        """Returns a copy of the element that shares its coefficients."""
+        self._release_scratch()
+        element = FiniteFieldElement._from_field(self._a, self._field)
+        element._a_orig = self._a_orig
+        element._a_matrix = self._a_matrix
+        element._code = self._code
+        return element
+
+    # the coefficients may live in the in-place buffer - once they are
+    # handed out, the element gives the buffer up (see '_release_scratch')
+    @property
+    def a(self) -> np.ndarray:
+        self._release_scratch()
+        return self._a
+
+    @property
+    def a_orig(self) -> Union[np.ndarray, List[int]]:
+        self._release_scratch()
+        return self._a_orig
 
     @property
     def fx(self) -> np.ndarray:
@@ -93,6 +174,8 @@ class FiniteFieldElement(AbstractFieldElement):
 
     @property
     def a_matrix(self) -> np.ndarray:
+        if self._a_matrix is None:
+            self._a_matrix = self.element_embedding_GLn(self._a)
         return self._a_matrix
 
     @property
@@ -102,15 +185,15 @@ class FiniteFieldElement(AbstractFieldElement):
     # OPERATOR OVERLOADING:
     # Defines how basic operations (such addition, subtraction, etc.)
     # of two objects of the class will be performed.
-    # Here we're basing our operations on the matrix representation of
-    # the element.
+    # Here we're basing our operations on the coefficient vectors of the
+    # elements (division and inversion use the field's log tables when
+    # available).
     def __add__(self, other: "FiniteFieldElement") -> Optional["FiniteFieldElement"]:
         try:
             self.type_check(other)
             self._check_other_is_from_the_same_field(other, "Addition")
-            mat_result = self._a_matrix + other.a_matrix
-            result = np.mod(mat_result, self._p) 
-            return FiniteFieldElement(result[0, :], self._p, self._fx)
+            result = np.mod(self._a + other.a, self._p)
+            return FiniteFieldElement._from_field(result, self._field)
         except Exception as e:
             log.error(e)
 
@@ -118,9 +201,8 @@ class FiniteFieldElement(AbstractFieldElement):
         try:
             self.type_check(other)
             self._check_other_is_from_the_same_field(other, "Subtraction")
-            mat_result = self._a_matrix - other.a_matrix
-            result = np.mod(mat_result, self._p)   
-            return FiniteFieldElement(result[0, :], self._p, self._fx)
+            result = np.mod(self._a - other.a, self._p)
+            return FiniteFieldElement._from_field(result, self._field)
         except Exception as e:
             log.error(e)
 
@@ -128,23 +210,26 @@ class FiniteFieldElement(AbstractFieldElement):
         try:
             self.type_check(other)
             self._check_other_is_from_the_same_field(other, "Multiplication")
-            mat_result = self._a_matrix @ other.a_matrix
-            result = np.mod(mat_result, self._p) 
-            return FiniteFieldElement(result[0,:], self._p, self._fx)
+            result = self._field.mul_vectors(self._a, other.a)
+            return FiniteFieldElement._from_field(result, self._field)
         except Exception as e:
             log.error(e)
 
     def __truediv__(self, other: "FiniteFieldElement") -> Optional["FiniteFieldElement"]:
         self.type_check(other)
-        # 'GFp' is a field class of type 'galois'
-        GFp = galois.GF(self._p**self._n)
-        a_matrix = GFp(self._a_matrix.astype('int'))
         try:
             self._check_other_is_from_the_same_field(other, "Division")
-            other_inv = np.linalg.inv(GFp(other.a_matrix.astype('int')))
-            result = a_matrix @ other_inv
-            result = result.tolist()
-            return FiniteFieldElement(result[0], self._p, self._fx)
+            tables = self._field.log_tables
+            if tables is not None:
+                return self._from_code(
+                    tables.div(self._get_code(), other._get_code())
+                )
+
+            if np.all(other.a == 0):
+                raise ZeroDivisionError("tried to divide by the zero element")
+            other_inv = self._field.inv_vectors(other.a)
+            result = self._field.mul_vectors(self._a, other_inv)
+            return FiniteFieldElement._from_field(result, self._field)
         except Exception as e:
             log.error(e)
 
@@ -153,15 +238,70 @@ class FiniteFieldElement(AbstractFieldElement):
             if np.all(self._a == 0):
                 raise ValueError("tried to invert the zero element")
 
-            GFp = galois.GF(self._p**self._n)
-            matrix = GFp(self._a_matrix.astype("int"))
-            matrix_inv = np.linalg.inv(matrix)
-            result = matrix_inv[0, :].view(np.ndarray)
-            return FiniteFieldElement(result, self._p, self._fx)
+            tables = self._field.log_tables
+            if tables is not None:
+                return self._from_code(tables.inv(self._get_code()))
+
+            result = self._field.inv_vectors(self._a)
+            return FiniteFieldElement._from_field(result, self._field)
 
         except Exception as e:
             log.error(str(e))
 
+    # IN-PLACE OPERATORS:
+    # 'a += b', 'a -= b' and 'a *= b' update 'a' itself. The result is
+    # written to the element's own buffer - never to coefficients that
+    # may be shared with other elements or arrays. The buffer is given up
+    # once its coefficients are shared (through 'a', 'a_orig' or 'copy'),
+    # and the next in-place operation allocates a new one.
+    def __iadd__(self, other: "FiniteFieldElement") -> Optional["FiniteFieldElement"]:
+        try:
+            self.type_check(other)
+            self._check_other_is_from_the_same_field(other, "Addition")
+            out = self._get_scratch()
+            np.add(self._a, other._a, out=out)
+            return self._assign(np.mod(out, self._p, out=out))
+        except Exception as e:
+            log.error(e)
+
+    def __isub__(self, other: "FiniteFieldElement") -> Optional["FiniteFieldElement"]:
+        try:
+            self.type_check(other)
+            self._check_other_is_from_the_same_field(other, "Subtraction")
+            out = self._get_scratch()
+            np.subtract(self._a, other._a, out=out)
+            return self._assign(np.mod(out, self._p, out=out))
+        except Exception as e:
+            log.error(e)
+
+    def __imul__(self, other: "FiniteFieldElement") -> Optional["FiniteFieldElement"]:
+        try:
+            self.type_check(other)
+            self._check_other_is_from_the_same_field(other, "Multiplication")
+            out = self._get_scratch()
+            return self._assign(self._field.mul_vectors(self._a, other._a, out=out))
+        except Exception as e:
+            log.error(e)
+
+    def _get_scratch(self) -> np.ndarray:
+        if self._scratch is None:
+            self._scratch = np.empty(self._n, dtype=self._field.dtype)
+        return self._scratch
+
+    def _release_scratch(self) -> None:
+        # the coefficients are shared from now on - the buffer is no
+        # longer written to
+        if self._scratch is not None and self._a is self._scratch:
+            self._scratch = None
+
+    def _assign(self, a: np.ndarray) -> "FiniteFieldElement":
+        """Sets the coefficients, and drops the values derived from them."""
+        self._a = a
+        self._a_orig = a
+        self._a_matrix = None
+        self._code = None
+        return self
+
     # we added equality check overload
     def __eq__(self, other: "FiniteFieldElement") -> bool:
         self.type_check(other)
@@ -178,7 +318,8 @@ class FiniteFieldElement(AbstractFieldElement):
         opration: str
     ) -> None:
 
-        if self._p != other.p or self._n != other.n:
+        # fields are interned, so elements of the same field share it
+        if self._field is not other.field:
             raise ValueError(
                 f"\nOperation '{opration}' is applicable only between " +
                 "elements of the same field.\n" +
@@ -187,14 +328,15 @@ class FiniteFieldElement(AbstractFieldElement):
 
     def element_embedding_GLn(self, a: np.ndarray) -> np.ndarray:   
         basis_matrix = self._field.span
-        # element-wise multiplication between a (reshaped to align dimensions)
-        # and basis_matrix
-        elements_sum = np.sum(
-            a[:, np.newaxis, np.newaxis] * basis_matrix,
-            axis=0
-        )
-        element = np.mod(elements_sum, self._p)
-        return element
+        if self._field.use_kernels:
+            return kernels.embed(
+                self._field.vectors(a), basis_matrix, self._p
+            )
+        # sum of a_i * basis_matrix[i] - a vector-matrix product over the
+        # flattened basis matrices, computed exactly mod p by the field
+        flat_basis = basis_matrix.reshape(self._n, -1)
+        element = self._field.dot(a, flat_basis)
+        return element.reshape(basis_matrix.shape[1:])
 
     def pretty_print(
         self,
@@ -213,7 +355,7 @@ class FiniteFieldElement(AbstractFieldElement):
                 + str(np.polynomial.Polynomial(self._a))
 
         elif print_mode is PrintMode.MATRIX:
-            matrix = str(self._a_matrix.astype(int)) \
+            matrix = str(self.a_matrix.astype(int)) \
                 .replace("[", " ") \
                 .replace("]", " ")
             print_msg = f"Element ({print_mode.name}) =\n{matrix}"
@@ -225,30 +367,49 @@ class FiniteFieldElement(AbstractFieldElement):
 
     def get_multiplicative_identity(self) -> "FiniteFieldElement":
         """Returns the multiplicative identity element (1) of the finite field."""
-        return FiniteFieldElement(np.eye(self._n)[0, :], self._p, self._fx) 
+        identity = np.zeros(self._n, dtype=self._field.dtype)
+        identity[0] = 1
+        return FiniteFieldElement._from_field(identity, self._field)
+
+    def exp_by_squaring(self, n: int) -> Optional["FiniteFieldElement"]:
+        """
+        Computes self^n. The power is computed on the coefficient vector by
+        'FiniteField.pow_vectors' - in the compiled kernels, or with the
+        exponent written in base p (Frobenius maps) when that is cheaper
+        than squaring.
+        """
+        try:
+            # a^(-n) = (a^(-1))^n
+            base = self._field.inv_vectors(self._a) if n < 0 else self._a
+            result = self._field.pow_vectors(base, abs(n))
+            return FiniteFieldElement._from_field(result, self._field)
+        except Exception as e:
+            log.error(e)
 
     def mul_order(self) -> Optional[int]:
         """
         Computes the multiplicative order of 'a' in the finite field.
         The multiplicative order of an element a is the smallest positive
         integer k such that a^k = I (identity matrix) (mod p).
-        Uses fast exponentiation for efficiency.
+        The order divides q-1 = p^n - 1, so starting from q-1 every prime
+        factor r (from the field's cached factorization) is stripped while
+        a^(k/r) = 1. Uses fast exponentiation for efficiency.
+        With the field's log tables the order is (q-1) / gcd(log(a), q-1).
         """
         if np.all(self._a == 0):
             log.error("a is zero, not in the prime field")
             return
 
-        max_order = self._p**self._n - 1
-        identity = self.get_multiplicative_identity()
-        result = deepcopy(self)
-        
-        for pow in range(1, max_order + 1):
-            if np.all(result._a == identity._a):
-                return pow
-
-            result *= self
+        tables = self._field.log_tables
+        if tables is not None:
+            return tables.mul_order(self._get_code())
 
-        log.error(
-            "multiplicative order not found, " +
-            "possible issue with element or field properties."
-        )
+        identity = self.get_multiplicative_identity()
+        order = self._field.order - 1
+        for prime, exp in self._field.order_factors.items():
+            for _ in range(exp):
+                power = self._field.pow_vectors(self._a, order // prime)
+                if not np.all(power == identity._a):
+                    break
+                order //= prime
+        return order
@@ -0,0 +1,325 @@
+from src.field_elements.finite_field_element import FiniteFieldElement
+from src.fields import FiniteField
+
+import common.log.logging_handler as log
+
+from typing import List, Union, Optional
+
+import numpy as np
+
+
+class FiniteFieldElementArray:
+    """
+    Represents a batch of N elements of one finite field, stored as a
+    contiguous (N, n) integer array of coefficients (one row per element).
+
+    All the operations are element-wise and vectorized - a batch is
+    processed in a few NumPy calls instead of N 'FiniteFieldElement'
+    objects (each with its own operations and matrix embedding).
+
+    Features:
+    - Element-wise addition, subtraction, multiplication, division,
+      inversion and powering, between two arrays of the same length or
+      between an array and a single 'FiniteFieldElement'.
+    - Equality masks ('==' returns a boolean array).
+    - Reductions: 'sum' and 'prod' of all the elements.
+    - Uses the field's discrete log tables for inversion and division when
+      available.
+
+    Attributes:
+        a (np.ndarray): The (N, n) array of coefficients.
+        p (int): The prime number defining the finite field.
+        fx (np.ndarray): The irreducible polynomial defining the field extension.
+        n (int): The degree of the field extension.
+        field (FiniteField): The finite field associated with the elements.
+    """
+    __slots__ = ("_field", "_a")
+
+    def __init__(
+        self,
+        a: Union[np.ndarray, List[List[int]]],
+        p: int,
+        fx: Union[np.ndarray, List[int]]
+    ) -> None:
+        try:
+            # reducible field would raise an error
+            field = FiniteField.get(p, fx)
+        except Exception as e:
+            # raising a more accurate error
+            raise ValueError(
+                "FiniteFieldElementArray creation failed due to a field " +
+                f"creation error:\n{e}"
+            )
+
+        a_arr = field.vectors(a)
+        if a_arr.ndim != 2:
+            raise ValueError(
+                f"Expected a 2-dimensional array of coefficients, got {a_arr.ndim} dimensions"
+            )
+        # number of coefficients can't be greater than the field degree
+        if a_arr.shape[1] > field.n:
+            raise ValueError(
+                f"Got {a_arr.shape[1]} coefficients for a field of degree {field.n}"
+            )
+        a_mod = np.mod(a_arr, field.p)
+        # pad missing (high degree) coefficients with zeros
+        if a_arr.shape[1] < field.n:
+            a_mod = np.pad(a_mod, ((0, 0), (0, field.n - a_arr.shape[1])))
+
+        self._field = field
+        self._a = np.ascontiguousarray(a_mod)
+
+    @classmethod
+    def _from_field(
+        cls,
+        a: np.ndarray,
+        field: FiniteField
+    ) -> "FiniteFieldElementArray":
+        """
+        Creates an array of an existing field from coefficients that are
+        already reduced mod p (skips the input validation).
+        """
+        array = cls.__new__(cls)
+        array._field = field
+        array._a = np.ascontiguousarray(field.vectors(a))
+        return array
+
+    @classmethod
+    def from_elements(
+        cls,
+        elements: List[FiniteFieldElement]
+    ) -> "FiniteFieldElementArray":
+        """Stacks elements of the same field into an array."""
+        if len(elements) == 0:
+            raise ValueError("Can't create an array from an empty list")
+
+        field = elements[0].field
+        for element in elements:
+            if element.field is not field:
+                raise ValueError(
+                    "All the elements of an array must belong to the same field"
+                )
+        return cls._from_field(
+            np.array([element.a for element in elements]),
+            field
+        )
+
+    @property
+    def a(self) -> np.ndarray:
+        return self._a
+
+    @property
+    def p(self) -> int:
+        return self._field.p
+
+    @property
+    def fx(self) -> np.ndarray:
+        return self._field.fx
+
+    @property
+    def n(self) -> int:
+        return self._field.n
+
+    @property
+    def field(self) -> FiniteField:
+        return self._field
+
+    def __len__(self) -> int:
+        return len(self._a)
+
+    def __getitem__(
+        self,
+        idx: Union[int, slice, np.ndarray]
+    ) -> Union[FiniteFieldElement, "FiniteFieldElementArray"]:
+        if isinstance(idx, (int, np.integer)):
+            return FiniteFieldElement._from_field(self._a[idx], self._field)
+        return FiniteFieldElementArray._from_field(self._a[idx], self._field)
+
+    def to_elements(self) -> List[FiniteFieldElement]:
+        return [self[i] for i in range(len(self))]
+
+    # OPERATOR OVERLOADING:
+    # Operations are element-wise. The other operand can be an array of
+    # the same length or a single element (applied to all the rows).
+    def __add__(
+        self,
+        other: Union["FiniteFieldElementArray", FiniteFieldElement]
+    ) -> Optional["FiniteFieldElementArray"]:
+        try:
+            other_a = self._get_other_coefficients(other, "Addition")
+            return self._new(np.mod(self._a + other_a, self.p))
+        except Exception as e:
+            log.error(e)
+
+    def __sub__(
+        self,
+        other: Union["FiniteFieldElementArray", FiniteFieldElement]
+    ) -> Optional["FiniteFieldElementArray"]:
+        try:
+            other_a = self._get_other_coefficients(other, "Subtraction")
+            return self._new(np.mod(self._a - other_a, self.p))
+        except Exception as e:
+            log.error(e)
+
+    def __mul__(
+        self,
+        other: Union["FiniteFieldElementArray", FiniteFieldElement]
+    ) -> Optional["FiniteFieldElementArray"]:
+        try:
+            other_a = self._get_other_coefficients(other, "Multiplication")
+            return self._new(self._mul(self._a, other_a))
+        except Exception as e:
+            log.error(e)
+
+    def __truediv__(
+        self,
+        other: Union["FiniteFieldElementArray", FiniteFieldElement]
+    ) -> Optional["FiniteFieldElementArray"]:
+        try:
+            other_a = self._get_other_coefficients(other, "Division")
+            other_inv = self._inv(np.atleast_2d(other_a))
+            return self._new(self._mul(self._a, other_inv))
+        except Exception as e:
+            log.error(e)
+
+    def __invert__(self) -> Optional["FiniteFieldElementArray"]:
+        try:
+            return self._new(self._inv(self._a))
+        except Exception as e:
+            log.error(e)
+
+    def __pow__(
+        self,
+        exp: Union[int, np.ndarray, List[int]]
+    ) -> Optional["FiniteFieldElementArray"]:
+        """
+        Raises every element to the power exp. exp can be a single exponent
+        or an array with one exponent per element (negative exponents are
+        allowed for non-zero elements).
+        """
+        try:
+            return self._new(self._pow(self._a, exp))
+        except Exception as e:
+            log.error(e)
+
+    def __eq__(
+        self,
+        other: Union["FiniteFieldElementArray", FiniteFieldElement]
+    ) -> np.ndarray:
+        """Returns a boolean mask of the element-wise equality."""
+        other_a = self._get_other_coefficients(other, "Equality")
+        return np.all(self._a == other_a, axis=-1)
+
+    def sum(self) -> FiniteFieldElement:
+        """Returns the sum of all the elements."""
+        # python ints when the column sums could overflow int64
+        a = self._a if len(self._a) * self.p < 2**63 else self._a.astype(object)
+        result = self._field.vectors(np.mod(a.sum(axis=0), self.p))
+        return FiniteFieldElement._from_field(result, self._field)
+
+    def prod(self) -> FiniteFieldElement:
+        """
+        Returns the product of all the elements.
+        The rows are multiplied pairwise (a tree of log(N) vectorized
+        multiplications).
+        """
+        result = self._a
+        identity = self._identity(1)
+        while len(result) > 1:
+            if len(result) % 2 == 1:
+                result = np.concatenate((result, identity))
+            half = len(result) // 2
+            result = self._mul(result[:half], result[half:])
+        if len(result) == 0:
+            result = identity
+        return FiniteFieldElement._from_field(result[0], self._field)
+
+    def _new(self, a: np.ndarray) -> "FiniteFieldElementArray":
+        return FiniteFieldElementArray._from_field(a, self._field)
+
+    def _get_other_coefficients(
+        self,
+        other: Union["FiniteFieldElementArray", FiniteFieldElement],
+        opration: str
+    ) -> np.ndarray:
+        """
+        Validates the other operand and returns its coefficients,
+        (N, n) for an array or (n,) for a single element.
+        """
+        if not isinstance(other, (FiniteFieldElementArray, FiniteFieldElement)):
+            raise TypeError(
+                f"Invalid type for variable: expected {type(self)} or " +
+                f"{FiniteFieldElement}, got {type(other).__name__}"
+            )
+
+        if self._field is not other.field:
+            raise ValueError(
+                f"\nOperation '{opration}' is applicable only between " +
+                "elements of the same field.\n" +
+                f"self: P={self.p} n={self.n} | other: P={other.p} n={other.n}"
+            )
+
+        if isinstance(other, FiniteFieldElementArray):
+            if len(other) != len(self):
+                raise ValueError(
+                    f"Operation '{opration}' requires arrays of the same " +
+                    f"length, got {len(self)} and {len(other)}"
+                )
+            return other.a
+        return self._field.vectors(other.a)
+
+    def _identity(self, count: int) -> np.ndarray:
+        identity = np.zeros((count, self.n), dtype=self._field.dtype)
+        identity[:, 0] = 1
+        return identity
+
+    def _codes(self, a: np.ndarray) -> np.ndarray:
+        return a @ self._field.code_powers
+
+    def _decode(self, codes: np.ndarray) -> np.ndarray:
+        return (codes[..., np.newaxis] // self._field.code_powers) % self.p
+
+    def _mul(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return self._field.mul_vectors(a, b)
+
+    def _inv(self, a: np.ndarray) -> np.ndarray:
+        if np.any(np.all(a == 0, axis=-1)):
+            raise ValueError("tried to invert the zero element")
+
+        tables = self._field.log_tables
+        if tables is not None:
+            logs = tables.log_table[self._codes(a)].astype(np.int64)
+            codes = tables.exp_table[(-logs) % (self._field.order - 1)]
+            return self._decode(codes)
+        return self._field.inv_vectors(a)
+
+    def _pow(
+        self,
+        a: np.ndarray,
+        exp: Union[int, np.ndarray, List[int]]
+    ) -> np.ndarray:
+        group_order = self._field.order - 1
+        # exponents are kept as python ints until they are reduced
+        e = np.broadcast_to(np.asarray(exp, dtype=object), (len(a),))
+        is_zero = np.all(a == 0, axis=-1)
+        if np.any(is_zero & (e < 0).astype(bool)):
+            raise ValueError("tried to invert the zero element")
+
+        # a^(q-1) = 1 for non-zero a - exponents are reduced mod q-1
+        # (zero elements keep 0^0 = 1 and 0^e = 0 for e > 0)
+        e_mod = np.where(
+            is_zero, np.minimum(e, 1), e % group_order
+        ).astype(np.int64 if group_order < 2**63 else object)
+
+        # vectorized exponentiation by squaring - exponents are processed
+        # bit by bit for all the rows at once
+        result = self._identity(len(a))
+        base = a
+        while np.any(e_mod):
+            odd = (e_mod & 1).astype(bool)
+            result = np.where(
+                odd[:, np.newaxis], self._field.mul_vectors(result, base), result
+            )
+            base = self._field.mul_vectors(base, base)
+            e_mod >>= 1
+        return result
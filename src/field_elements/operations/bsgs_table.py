@@ -0,0 +1,149 @@
+from src.fields import FiniteField
+import common.consts as consts
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+import numpy as np
+import os
+
+
+class BSGSTable:
+    """
+    Baby-step table of the Baby-Step Giant-Step algorithm: the codes of
+    g^0, g^1, ..., g^(m-1) (the field's integer encoding), sorted, next to
+    their exponents. A batch of giant steps is looked up with a single
+    'np.searchsorted' call.
+
+    Tables are built once per (p, f(x), g, m) and cached:
+    - In memory, for the last BSGS_TABLE_CACHE_ENTRIES tables.
+    - On disk, for tables of at least BSGS_TABLE_PERSIST_MIN_SIZE entries
+      (and codes that fit in int64), as .npy files in BSGS_TABLE_CACHE_DIR.
+      Later runs and other processes memory-map the file instead of
+      rebuilding the table, so the pages are shared between workers.
+      A file that can't be read (e.g. truncated) is rebuilt and rewritten.
+
+    Attributes:
+        codes (np.ndarray): The sorted codes of the baby steps.
+        exponents (np.ndarray): exponents[i] is j such that code(g^j) = codes[i].
+        size (int): The number of baby steps m.
+    """
+    # most recently used tables, keyed by (p, f(x), code(g), m)
+    _CACHE: "OrderedDict[Tuple, BSGSTable]" = OrderedDict()
+
+    def __init__(self, codes: np.ndarray, exponents: np.ndarray, size: int) -> None:
+        self._codes = codes
+        self._exponents = exponents
+        self._size = size
+
+    @property
+    def codes(self) -> np.ndarray:
+        return self._codes
+
+    @property
+    def exponents(self) -> np.ndarray:
+        return self._exponents
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @classmethod
+    def get(
+        cls,
+        field: FiniteField,
+        generator: np.ndarray,
+        size: int
+    ) -> "BSGSTable":
+        """
+        Returns the table of g^0, ..., g^(size-1), from the memory cache,
+        the disk cache, or built (and cached) on a miss.
+        """
+        key = (
+            field.p, tuple(int(c) for c in field.fx),
+            field.encode(generator), size
+        )
+        table = cls._CACHE.get(key)
+        if table is not None:
+            cls._CACHE.move_to_end(key)
+            return table
+
+        persist = (
+            size >= consts.BSGS_TABLE_PERSIST_MIN_SIZE and
+            field.code_powers.dtype == np.int64
+        )
+        path = cls.path(key)
+        if persist and os.path.exists(path):
+            table = cls.load(path, size)
+        if table is None:
+            table = cls.build(field, generator, size)
+            if persist:
+                table.save(path)
+
+        cls._CACHE[key] = table
+        if len(cls._CACHE) > consts.BSGS_TABLE_CACHE_ENTRIES:
+            cls._CACHE.popitem(last=False)
+        return table
+
+    @classmethod
+    def build(
+        cls,
+        field: FiniteField,
+        generator: np.ndarray,
+        size: int
+    ) -> "BSGSTable":
+        codes = powers(field, generator, size) @ field.code_powers
+        # stable sort - the first of equal codes has the smallest exponent
+        order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[order]
+        first = np.ones(len(sorted_codes), dtype=bool)
+        first[1:] = sorted_codes[1:] != sorted_codes[:-1]
+        return cls(sorted_codes[first], order[first].astype(np.int64), size)
+
+    @classmethod
+    def load(cls, path: str, size: int) -> Optional["BSGSTable"]:
+        """
+        Memory-maps a saved table. None if the file is not a valid table
+        (truncated, corrupt, or of another format).
+        """
+        try:
+            data = np.load(path, mmap_mode="r")
+        except (OSError, ValueError, EOFError):
+            return
+        if data.ndim != 2 or data.shape[0] != 2 or data.dtype != np.int64:
+            return
+        return cls(data[0], data[1], size)
+
+    @staticmethod
+    def path(key: Tuple) -> str:
+        p, fx, generator_code, size = key
+        name = f"p{p}_fx{'-'.join(map(str, fx))}_g{generator_code}_m{size}.npy"
+        return os.path.join(consts.BSGS_TABLE_CACHE_DIR, name)
+
+    def save(self, path: str) -> None:
+        """Writes the table (atomically - readers never see a partial file)."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.stack((self._codes, self._exponents)))
+        os.replace(tmp_path, path)
+
+    def lookup(self, codes: np.ndarray) -> np.ndarray:
+        """Returns the exponents of the given codes (-1 where not found)."""
+        idx = np.searchsorted(self._codes, codes)
+        idx = np.minimum(idx, len(self._codes) - 1)
+        found = self._codes[idx] == codes
+        return np.where(found, self._exponents[idx], -1)
+
+
+def powers(field: FiniteField, a: np.ndarray, count: int) -> np.ndarray:
+    """
+    Returns a^0, a^1, ..., a^(count-1) as a (count, n) array. The table is
+    doubled until it is long enough: a^(k+i) = a^i * a^k for the k rows
+    computed so far, so every power costs a single (vectorized) product.
+    """
+    result = field.pow_vectors(a, 0)[np.newaxis]
+    step = field.vectors(a)
+    while len(result) < count:
+        result = np.concatenate((result, field.mul_vectors(result, step)))
+        step = field.mul_vectors(step, step)
+    return result[:count]
@@ -1,15 +1,27 @@
+from src.field_elements.operations.bsgs_table import BSGSTable, powers
 from src.field_elements.operations import math_helper
-from src.field_elements import FiniteFieldElement
+from src.fields.operations import factor_helper
+from src.field_elements import FiniteFieldElement, FiniteFieldElementArray
+from src.fields import FiniteField
 import common.log.logging_handler as log
 import common.consts as consts
 
-from typing import List, Union, Optional
+from queue import Empty
+from typing import Dict, List, Tuple, Union, Optional
 import numpy as np
+import random
+import math
+import multiprocessing
+import time
+import os
 
 
 def discrete_log_bsgs(
     h: Union[np.ndarray, List[int]],
-    generator: FiniteFieldElement
+    generator: FiniteFieldElement,
+    table_size: Optional[int] = None,
+    lower: int = 0,
+    upper: Optional[int] = None
 ) -> Optional[int]:
     """
     Implements the Baby-Step Giant-Step (BSGS) algorithm for solving the
@@ -19,9 +31,23 @@ def discrete_log_bsgs(
     an element 'h' in the group, this algorithm finds the exponent 'x'
     such that: g^x=h (mod p)
 
+    The baby steps g^0, ..., g^(m-1) (m = ceil(sqrt(q-1)) by default) are
+    a 'BSGSTable' of sorted element codes, and the giant steps
+    h, h*g^(-m), h*g^(-2m), ... are looked up in it a block at a time -
+    O(sqrt(q)) time and memory in total.
+    The table is cached per (field, generator, m), in memory and on disk,
+    so repeated queries with the same generator only take giant steps.
+    A larger table_size means fewer giant steps per query.
+    When x is known to lie in an interval [a, b], the search runs on
+    h*g^(-a) over b-a+1 exponents only - the default m is then
+    ceil(sqrt(b-a+1)).
+
     Args:
         h: The target element for which the discrete log is computed.
         generator: The generator of the multiplicative group.
+        table_size: Number of baby steps m (default ceil(sqrt(q-1))).
+        lower: Lower bound a of the discrete log (default 0).
+        upper: Upper bound b of the discrete log (default q-2).
 
     Returns:
         The discrete logarithm x such that g^x = h, or None if an error occurs.
@@ -30,48 +56,600 @@ def discrete_log_bsgs(
         log.error("Got None generator for 'discrete_log_bsgs")
         return
 
-    # Calculate the order of the multiplicative group
-    order = generator.p**generator.n - 1
-    m = int(np.ceil(order**0.5))
-    
-    # Create baby steps table: [g^0, g^1, g^2, ..., g^(m-1)]
-    baby_steps = []
-    for pow_j in range(m):
-        # Make sure to pass generator as both self and first argument 
-        # to match the reference implementation
-        baby_step = generator.exp_by_squaring(pow_j)
-        if baby_step is None:
-            log.error(f"failed to compute g^{pow_j}")
-            continue
-        baby_steps.append(baby_step.a)
+    field = generator.field
+    upper = field.order - 2 if upper is None else upper
+    if not 0 <= lower <= upper:
+        log.error(f"Invalid interval for the discrete log: [{lower}, {upper}]")
+        return
+    # Convert h to a field element
+    h_element = FiniteFieldElement(h, generator.p, generator.fx)
+    try:
+        shifted = field.mul_vectors(
+            h_element.a, field.inv_vectors(field.pow_vectors(generator.a, lower))
+        )
+        x = _bsgs(
+            field, generator.a, shifted, upper - lower + 1, table_size
+        )
+    except Exception as e:
+        log.error(f"failed to compute g^(-m): {e}")
+        return
 
-    # Calculate g^(-m) for giant steps
-    gen_pow_neg_m = generator.exp_by_squaring(-m)
-    if gen_pow_neg_m is None:
-        log.error("failed to compute g^(-m)")
+    if x is None:
+        log.error(f"No discrete logarithm found for the given element")
         return
+    return lower + x
 
-    # Convert h to a field element
+
+def discrete_log_bsgs_many(
+    hs: Union[FiniteFieldElementArray, np.ndarray, List[List[int]]],
+    generator: FiniteFieldElement,
+    table_size: Optional[int] = None
+) -> Optional[np.ndarray]:
+    """
+    Batched Baby-Step Giant-Step: the discrete logs of many targets
+    h_1, ..., h_N to the same generator, in one pass.
+
+    All the targets share one (cached) 'BSGSTable', and their giant steps
+    advance together - every round multiplies the (N', n) array of the
+    unresolved targets by g^(-m) and looks all of it up at once.
+    With N targets the cost is balanced by a table of sqrt(N*(q-1))
+    baby steps (capped by BSGS_MANY_MAX_TABLE_SIZE), which is the default.
+
+    Args:
+        hs: The target elements - an array of the generator's field, or
+            an (N, n) array of coefficients.
+        generator: The generator of the multiplicative group.
+        table_size: Number of baby steps m.
+
+    Returns:
+        An array of N logs (-1 where no logarithm was found), or None if
+        an error occurs.
+    """
+    if generator is None:
+        log.error("Got None generator for 'discrete_log_bsgs_many")
+        return
+
+    try:
+        field = generator.field
+        if not isinstance(hs, FiniteFieldElementArray):
+            hs = FiniteFieldElementArray(hs, generator.p, generator.fx)
+        elif hs.field is not field:
+            raise ValueError(
+                "The targets and the generator must belong to the same field"
+            )
+
+        order = field.order - 1
+        if table_size is None:
+            table_size = min(
+                math.isqrt(order * max(len(hs), 1)),
+                max(consts.BSGS_MANY_MAX_TABLE_SIZE, math.isqrt(order))
+            ) + 1
+        m = max(1, min(table_size, order))
+        giants = -(-order // m)
+        table = BSGSTable.get(field, generator.a, m)
+        gen_pow_neg_m = field.inv_vectors(field.pow_vectors(generator.a, m))
+
+        logs = np.full(
+            len(hs), -1, dtype=np.int64 if order < 2**63 else object
+        )
+        # zero has no logarithm - it is never looked up
+        active = np.flatnonzero(np.any(hs.a != 0, axis=-1))
+        alphas = hs.a[active]
+        for i in range(giants):
+            if len(active) == 0:
+                break
+            exponents = table.lookup(alphas @ field.code_powers)
+            found = exponents >= 0
+            logs[active[found]] = i*m + exponents[found]
+            # only the unresolved targets take the next giant step
+            active, alphas = active[~found], alphas[~found]
+            alphas = field.mul_vectors(alphas, gen_pow_neg_m)
+        return logs
+    except Exception as e:
+        log.error(e)
+
+
+def discrete_log_pollard_rho(
+    h: Union[np.ndarray, List[int]],
+    generator: FiniteFieldElement,
+    seed: Optional[int] = None
+) -> Optional[int]:
+    """
+    Implements Pollard's rho algorithm for solving the discrete logarithm
+    problem in a finite field, in O(sqrt(q)) expected time and O(1) memory.
+
+    The walk y -> y * M_k, with k = code(y) mod r and M_k = g^(a_k) * h^(b_k)
+    for random a_k, b_k (an r-adding walk), keeps y = g^a * h^b. Brent's
+    cycle detection finds a collision g^a * h^b = g^a' * h^b', so
+    (b - b')*x ≡ a' - a (mod q-1). Its solutions are checked against h,
+    and the walk is restarted from a new random point when there are too
+    many of them.
+
+    Args:
+        h: The target element for which the discrete log is computed.
+        generator: The generator of the multiplicative group.
+        seed: Seed of the random walk (for reproducible runs).
+
+    Returns:
+        The discrete logarithm x such that g^x = h, or None if an error occurs.
+    """
+    if generator is None:
+        log.error("Got None generator for 'discrete_log_pollard_rho")
+        return
+
+    field = generator.field
     h_element = FiniteFieldElement(h, generator.p, generator.fx)
-    
-    # Start with alpha = h
-    alpha = h_element.a
-    baby_steps = np.asarray(baby_steps)
-    
-    # Compute giant steps and look for matches
-    for i in range(m):
-        # Check if current alpha matches any baby step
-        matches = (alpha == baby_steps).all(axis=1)
-        if matches.any():
-            j = np.argwhere(matches)[0][0]
-            return i*m + j
-        else:
-            # Take a giant step: alpha = alpha * g^(-m)
-            alpha = (gen_pow_neg_m * h_element).a
+    if np.all(h_element.a == 0):
+        log.error("Got the zero element, which has no discrete logarithm")
+        return
+
+    x = _pollard_rho(
+        field, generator.a, h_element.a, field.order - 1, random.Random(seed)
+    )
+    if x is None:
+        log.error(f"No discrete logarithm found for the given element")
+    return x
+
+
+def discrete_log_parallel_rho(
+    h: Union[np.ndarray, List[int]],
+    generator: FiniteFieldElement,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    log_progress: Optional[bool] = True
+) -> Optional[int]:
+    """
+    Parallel Pollard rho with distinguished points (van Oorschot-Wiener),
+    for solving the discrete logarithm problem on all the cores.
+
+    Every worker process runs random walks of the same r-adding walk,
+    each from a random start g^a * h^b, until it reaches a distinguished
+    point (a code divisible by 2^k, with 2^k about sqrt(q)/W for W
+    workers - so the points a worker walks past the collision are a
+    small fraction of the sqrt(q) steps). Each point is sent to this
+    process as soon as it is found, and kept in a table - two walks that
+    reach the same point give a collision and (b - b')*x ≡ a' - a
+    (mod q-1). The workers are terminated once it is solved. Walks are
+    independent, so the expected time falls near-linearly with the
+    number of workers.
+
+    Args:
+        h: The target element for which the discrete log is computed.
+        generator: The generator of the multiplicative group.
+        workers: Number of worker processes (default: all the cores).
+        seed: Seed of the walk and of the starting points.
+        log_progress: Log the number of points and steps periodically.
+
+    Returns:
+        The discrete logarithm x such that g^x = h, or None if an error occurs.
+    """
+    if generator is None:
+        log.error("Got None generator for 'discrete_log_parallel_rho")
+        return
+
+    field = generator.field
+    order = field.order - 1
+    h_element = FiniteFieldElement(h, generator.p, generator.fx)
+    if np.all(h_element.a == 0):
+        log.error("Got the zero element, which has no discrete logarithm")
+        return
+
+    g, h_a = generator.a, h_element.a
+    rng = random.Random(seed)
+    steps = _walk_steps(field, g, h_a, order, rng)
+    workers = workers or os.cpu_count() or 1
+    dp_bits = max(
+        0,
+        order.bit_length() // 2 - (workers - 1).bit_length() -
+        consts.PARALLEL_RHO_DP_BITS_MARGIN
+    )
+    max_steps = consts.PARALLEL_RHO_MAX_STEPS_FACTOR * (math.isqrt(order) + 1)
+
+    # workers are forked from a clean server process (with this module
+    # preloaded) - forking this process, which may already run native
+    # thread pools (numba, BLAS), can deadlock
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    points_queue = context.Queue()
+    processes = [
+        context.Process(
+            target=_distinguished_points_worker,
+            args=(
+                field, g, h_a, steps, order, dp_bits, rng.getrandbits(64),
+                points_queue
+            ),
+            daemon=True
+        )
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    # distinguished point code -> (a, b) of the walk that reached it
+    points: Dict[int, Tuple[int, int]] = {}
+    total_steps, last_report, start = 0, time.monotonic(), time.monotonic()
+    try:
+        while total_steps < max_steps:
+            try:
+                code, a, b, walk_steps = points_queue.get(
+                    timeout=consts.PARALLEL_RHO_PROGRESS_SECONDS
+                )
+            except Empty:
+                if not any(process.is_alive() for process in processes):
+                    break
+            else:
+                total_steps += walk_steps
+                # None marks a dropped walk (only its steps are reported)
+                if code is not None:
+                    other = points.setdefault(code, (a, b))
+                    if other != (a, b):
+                        x = _solve_collision(
+                            field, g, h_a, order, a, b, *other
+                        )
+                        if x is not None:
+                            return x
+
+            if log_progress and (
+                time.monotonic() - last_report >= consts.PARALLEL_RHO_PROGRESS_SECONDS
+            ):
+                last_report = time.monotonic()
+                log.info(
+                    f"[parallel rho] {len(points)} distinguished points, " +
+                    f"{total_steps} steps ({workers} workers, " +
+                    f"{total_steps / (last_report - start):.0f} steps/s)"
+                )
+    finally:
+        # the walks never end on their own
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
 
     log.error(f"No discrete logarithm found for the given element")
 
 
+def _distinguished_points_worker(
+    field: FiniteField,
+    g: np.ndarray,
+    h: np.ndarray,
+    steps: List[Tuple[np.ndarray, int, int]],
+    order: int,
+    dp_bits: int,
+    seed: int,
+    points_queue: "multiprocessing.Queue"
+) -> None:
+    """
+    Runs walks from random starts until terminated, and puts the
+    (code, a, b, steps) of every distinguished point on the queue as soon
+    as it is reached. Walks that are too long (stuck in a cycle without
+    distinguished points) are dropped, and reported as (None, 0, 0, steps).
+    """
+    rng = random.Random(seed)
+    dp_mask = (1 << dp_bits) - 1
+    max_walk = consts.PARALLEL_RHO_MAX_WALK_FACTOR << dp_bits
+    while True:
+        a, b = rng.randrange(order), rng.randrange(order)
+        y = field.mul_vectors(field.pow_vectors(g, a), field.pow_vectors(h, b))
+        code = field.encode(y)
+        for walk_steps in range(max_walk):
+            # the walk picks M_k by code mod r - distinguished points
+            # are tested on the rest of the code
+            if (code // consts.POLLARD_RHO_PARTITIONS) & dp_mask == 0:
+                points_queue.put((code, a, b, walk_steps))
+                break
+            m_k, a_k, b_k = steps[code % consts.POLLARD_RHO_PARTITIONS]
+            y = field.mul_vectors(y, m_k)
+            code = field.encode(y)
+            a, b = (a + a_k) % order, (b + b_k) % order
+        else:
+            points_queue.put((None, 0, 0, max_walk))
+
+
+def discrete_log_kangaroo(
+    h: Union[np.ndarray, List[int]],
+    generator: FiniteFieldElement,
+    lower: int = 0,
+    upper: Optional[int] = None,
+    seed: Optional[int] = None
+) -> Optional[int]:
+    """
+    Implements Pollard's kangaroo (lambda) algorithm for solving the
+    discrete logarithm problem when x is known to lie in an interval [a, b].
+
+    Both kangaroos jump by g^s, with the jump size s picked from a small
+    set (of mean m ~ sqrt(b-a)/2) by the code of the current element. The
+    tame kangaroo starts at g^b and sets a trap where it stops, after
+    about 4m jumps at a known distance d. The wild kangaroo starts at h and
+    jumps until it lands in the trap - the paths merge once they share a
+    single point - or passes it. In the trap, x = b + d - (wild distance)
+    (mod q-1, as the walks may wrap around the group order).
+    This takes O(sqrt(b-a)) time and O(1) memory; a missed trap is retried
+    with new jump sizes.
+
+    Args:
+        h: The target element for which the discrete log is computed.
+        generator: The generator of the multiplicative group.
+        lower: Lower bound a of the discrete log (default 0).
+        upper: Upper bound b of the discrete log (default q-2).
+        seed: Seed of the jump sizes (for reproducible runs).
+
+    Returns:
+        The discrete logarithm x such that g^x = h, or None if an error occurs.
+    """
+    if generator is None:
+        log.error("Got None generator for 'discrete_log_kangaroo")
+        return
+
+    field = generator.field
+    upper = field.order - 2 if upper is None else upper
+    if not 0 <= lower <= upper:
+        log.error(f"Invalid interval for the discrete log: [{lower}, {upper}]")
+        return
+    h_element = FiniteFieldElement(h, generator.p, generator.fx)
+    if np.all(h_element.a == 0):
+        log.error("Got the zero element, which has no discrete logarithm")
+        return
+
+    x = _kangaroo(
+        field, generator.a, h_element.a, lower, upper, random.Random(seed)
+    )
+    if x is None:
+        log.error(f"No discrete logarithm found for the given element")
+    return x
+
+
+def _kangaroo(
+    field: FiniteField,
+    g: np.ndarray,
+    h: np.ndarray,
+    lower: int,
+    upper: int,
+    rng: random.Random
+) -> Optional[int]:
+    """
+    Kangaroo on coefficient vectors, for x in [lower, upper]. Returns None
+    if the wild kangaroo missed the trap in every attempt.
+    """
+    mean = math.isqrt(upper - lower) // 2 + 1
+    for _ in range(consts.KANGAROO_MAX_ATTEMPTS):
+        sizes = [rng.randint(1, 2 * mean) for _ in range(consts.KANGAROO_JUMPS)]
+        jumps = [field.pow_vectors(g, s) for s in sizes]
+
+        # tame kangaroo: from g^upper, sets the trap where it stops
+        y = field.pow_vectors(g, upper)
+        code, tame_distance = field.encode(y), 0
+        for _ in range(consts.KANGAROO_TAME_JUMPS_FACTOR * mean):
+            k = code % consts.KANGAROO_JUMPS
+            y = field.mul_vectors(y, jumps[k])
+            code, tame_distance = field.encode(y), tame_distance + sizes[k]
+        trap = code
+
+        # wild kangaroo: from h = g^x, passes the trap after jumping
+        # further than (upper - x) + tame_distance
+        y = h
+        code, wild_distance = field.encode(y), 0
+        while wild_distance <= upper - lower + tame_distance:
+            if code == trap:
+                # the distances only give x modulo the group order - the
+                # tame kangaroo may have wrapped around it
+                x = (
+                    (upper + tame_distance - wild_distance - lower) %
+                    (field.order - 1) + lower
+                )
+                if np.array_equal(field.pow_vectors(g, x), h):
+                    return x
+                break
+            k = code % consts.KANGAROO_JUMPS
+            y = field.mul_vectors(y, jumps[k])
+            code, wild_distance = field.encode(y), wild_distance + sizes[k]
+
+
+def discrete_log_pohlig_hellman(
+    h: Union[np.ndarray, List[int]],
+    generator: FiniteFieldElement,
+    seed: Optional[int] = None
+) -> Optional[int]:
+    """
+    Implements the Pohlig-Hellman algorithm for solving the discrete
+    logarithm problem in a finite field.
+
+    With N = ord(g) = r1^e1 * ... * rk^ek, x is found modulo every r^e and
+    the results are combined with the Chinese Remainder Theorem. Modulo r^e,
+    x = d0 + d1*r + ... + d_(e-1)*r^(e-1) is found digit by digit: d_k is
+    the log of (h * g^(-x_k))^(N/r^(k+1)) to the base g^(N/r), which lies
+    in the subgroup of order r (BSGS, or Pollard rho for large r).
+    The cost is O(sum e_i*(log N + sqrt(r_i))) instead of O(sqrt(N)).
+    The generator may be any non-zero element - the log is returned
+    modulo its order.
+
+    Args:
+        h: The target element for which the discrete log is computed.
+        generator: The base of the logarithm (usually a group generator).
+        seed: Seed of the random walks, when Pollard rho is used.
+
+    Returns:
+        The discrete logarithm x such that g^x = h, or None if an error occurs.
+    """
+    if generator is None:
+        log.error("Got None generator for 'discrete_log_pohlig_hellman")
+        return
+
+    field = generator.field
+    h_element = FiniteFieldElement(h, generator.p, generator.fx)
+    order = generator.mul_order()
+    if order is None:
+        return
+    if np.all(h_element.a == 0):
+        log.error("Got the zero element, which has no discrete logarithm")
+        return
+
+    g, h_a = generator.a, h_element.a
+    rng = random.Random(seed)
+    residues, moduli = [], []
+    for prime, exp in factor_helper.factorize(order).items():
+        # generator of the subgroup of order 'prime'
+        gamma = field.pow_vectors(g, order // prime)
+        x_k = 0
+        for k in range(exp):
+            # (h * g^(-x_k))^(N/r^(k+1)) = gamma^(d_k)
+            shifted = field.mul_vectors(
+                h_a, field.inv_vectors(field.pow_vectors(g, x_k))
+            )
+            h_k = field.pow_vectors(shifted, order // prime**(k + 1))
+            d_k = _subgroup_log(field, gamma, h_k, prime, rng)
+            if d_k is None:
+                log.error(
+                    "No discrete logarithm found for the given element " +
+                    f"(in the subgroup of order {prime})"
+                )
+                return
+            x_k += d_k * prime**k
+        residues.append(x_k)
+        moduli.append(prime**exp)
+
+    x = math_helper.chinese_remainder_theorem_general(residues, moduli)
+    # h may be outside the subgroup generated by g
+    if x is None or not np.array_equal(field.pow_vectors(g, x), h_a):
+        log.error(f"No discrete logarithm found for the given element")
+        return
+    return x
+
+
+def _subgroup_log(
+    field: FiniteField,
+    g: np.ndarray,
+    h: np.ndarray,
+    order: int,
+    rng: random.Random
+) -> Optional[int]:
+    """Discrete log in a subgroup of prime order, with BSGS or Pollard rho."""
+    if order <= consts.POHLIG_HELLMAN_BSGS_MAX_ORDER:
+        return _bsgs(field, g, h, order)
+    return _pollard_rho(field, g, h, order, rng)
+
+
+def _bsgs(
+    field: FiniteField,
+    g: np.ndarray,
+    h: np.ndarray,
+    order: int,
+    table_size: Optional[int] = None
+) -> Optional[int]:
+    """
+    BSGS on coefficient vectors, for x in [0, order) - 'order' is the
+    order of g (or a multiple of it), or the width of an interval.
+    Returns None if h is not such a power of g.
+    """
+    m = table_size or math.isqrt(order - 1) + 1
+    m = max(1, min(m, order))
+    giants = -(-order // m)
+    # Create (or load) baby steps table: g^0, g^1, ..., g^(m-1)
+    table = BSGSTable.get(field, g, m)
+
+    # Calculate g^(-m) for giant steps
+    gen_pow_neg_m = field.inv_vectors(field.pow_vectors(g, m))
+
+    # Giant steps are taken in blocks: alpha_(i+k) = alpha_i * g^(-mk)
+    block_size = min(giants, consts.BSGS_GIANT_STEPS_BLOCK)
+    block_steps = powers(field, gen_pow_neg_m, block_size)
+    block_factor = field.pow_vectors(gen_pow_neg_m, block_size)
+    alphas = field.mul_vectors(block_steps, h)
+
+    for i in range(0, giants, block_size):
+        # Check if a giant step matches a baby step
+        exponents = table.lookup(alphas @ field.code_powers)
+        hits = np.flatnonzero(exponents >= 0)
+        hits = hits[i + hits < giants]
+        if len(hits) > 0:
+            k = int(hits[0])
+            x = (i + k)*m + int(exponents[k])
+            return x if x < order else None
+        alphas = field.mul_vectors(alphas, block_factor)
+
+
+def _pollard_rho(
+    field: FiniteField,
+    g: np.ndarray,
+    h: np.ndarray,
+    order: int,
+    rng: random.Random
+) -> Optional[int]:
+    """
+    Pollard rho on coefficient vectors, where 'order' is the order of g.
+    Returns None if no walk ended with a usable collision.
+    """
+    for _ in range(consts.POLLARD_RHO_MAX_WALKS):
+        steps = _walk_steps(field, g, h, order, rng)
+        a, b = rng.randrange(order), rng.randrange(order)
+        y = field.mul_vectors(field.pow_vectors(g, a), field.pow_vectors(h, b))
+        hare = (y, field.encode(y), a, b)
+        tortoise = hare
+        # Brent: the tortoise jumps to the hare at powers of 2
+        power = lam = 1
+        while True:
+            if power == lam:
+                tortoise, power, lam = hare, power * 2, 0
+            y, code, a, b = hare
+            m_k, a_k, b_k = steps[code % consts.POLLARD_RHO_PARTITIONS]
+            y = field.mul_vectors(y, m_k)
+            hare = (y, field.encode(y), (a + a_k) % order, (b + b_k) % order)
+            lam += 1
+            if hare[1] == tortoise[1]:
+                break
+
+        x = _solve_collision(
+            field, g, h, order, hare[2], hare[3], tortoise[2], tortoise[3]
+        )
+        if x is not None:
+            return x
+
+
+def _walk_steps(
+    field: FiniteField,
+    g: np.ndarray,
+    h: np.ndarray,
+    order: int,
+    rng: random.Random
+) -> List[Tuple[np.ndarray, int, int]]:
+    """Multipliers M_k = g^(a_k) * h^(b_k) of an r-adding walk."""
+    steps = []
+    for _ in range(consts.POLLARD_RHO_PARTITIONS):
+        a_k, b_k = rng.randrange(order), rng.randrange(order)
+        m_k = field.mul_vectors(
+            field.pow_vectors(g, a_k), field.pow_vectors(h, b_k)
+        )
+        steps.append((m_k, a_k, b_k))
+    return steps
+
+
+def _solve_collision(
+    field: FiniteField,
+    g: np.ndarray,
+    h: np.ndarray,
+    order: int,
+    a: int,
+    b: int,
+    a_other: int,
+    b_other: int
+) -> Optional[int]:
+    """
+    Recovers x from a collision g^a * h^b = g^a' * h^b', which gives
+    (b - b')*x ≡ a' - a (mod order). None if the collision is useless
+    (too many candidate solutions, or none of them is the log).
+    """
+    solutions = math_helper.linear_congruence_solutions(
+        b - b_other, a_other - a, order
+    )
+    # the count is checked before any candidate is built
+    if solutions is None or solutions[2] > consts.POLLARD_RHO_MAX_SOLUTIONS:
+        return
+    x0, step, count = solutions
+    for k in range(count):
+        x = x0 + k * step
+        if np.array_equal(field.pow_vectors(g, x), h):
+            return x
+
+
 def discrete_log_lifting(
     a: int,
     b: int,
@@ -133,3 +711,121 @@ def discrete_log_lifting(
     if log_inner_steps is True:
         log.info(f"Combined solution: x ≡ {x} mod {(p - 1) * (p ** (s - 1))}")
     return x
+
+
+def discrete_log_mod_n(
+    a: int,
+    b: int,
+    n: int,
+    log_inner_steps: Optional[bool] = False
+) -> Optional[int]:
+    """
+    Given a, b in U_N for any modulus N, compute x such that a^x ≡ b (mod N).
+
+    N = p1^s1 * ... * pk^sk is factored, and every prime power gives
+    congruences on x:
+    - Odd p: x ≡ log_a(b) modulo ord_p(a), solved in GF(p) with a
+      sub-linear method, and θ(a)*x ≡ θ(b) (mod p^(s-1)) with the theta
+      homomorphism - the lifting attack, for any base a (the linear
+      congruence may have several solutions).
+    - p = 2: U_{2^s} is not cyclic, so x is found bit by bit in the
+      2-group generated by a (Pohlig-Hellman, O(s^2) multiplications).
+    The congruences are combined with the general Chinese Remainder
+    Theorem (the moduli, orders of a, are usually not coprime).
+
+    Returns the smallest such x (x is unique modulo ord_N(a)).
+    """
+    a, b = a % n, b % n
+    if math.gcd(a, n) != 1 or math.gcd(b, n) != 1:
+        log.error(f"{a} and {b} must be units modulo {n}")
+        return
+
+    residues, moduli = [], []
+    for p, s in factor_helper.factorize(n).items():
+        congruences = _discrete_log_prime_power_congruences(a, b, p, s)
+        if congruences is None:
+            log.error(
+                consts.DISCRETE_LOG_FAIL_MSG.format(
+                    a=a, b=b, p=p, s=s, func_name="discrete_log_mod_n"
+                )
+            )
+            return
+        if log_inner_steps is True:
+            log.info(
+                f"Solution mod {p}^{s}: " +
+                ", ".join(f"x ≡ {x} (mod {m})" for x, m in congruences)
+            )
+        for x, m in congruences:
+            residues.append(x)
+            moduli.append(m)
+
+    x = math_helper.chinese_remainder_theorem_general(residues, moduli)
+    if x is None or pow(a, x, n) != b:
+        log.error(f"No discrete logarithm found for the given element")
+        return
+    if log_inner_steps is True:
+        log.info(f"Combined solution: x = {x}")
+    return x
+
+
+def _discrete_log_prime_power_congruences(
+    a: int,
+    b: int,
+    p: int,
+    s: int
+) -> Optional[List[Tuple[int, int]]]:
+    """
+    Returns congruences (x_i, m_i) that a^x ≡ b (mod p^s) is equivalent
+    to, or None if b is not a power of a.
+    """
+    if p == 2:
+        congruence = _discrete_log_mod_power_of_2(a, b, s)
+        return None if congruence is None else [congruence]
+
+    x1 = math_helper.discrete_log_mod_p(a, b, p)
+    if x1 is None:
+        return
+    congruences = [(x1, math_helper.multiplicative_order_mod_p(a % p, p))]
+    if s > 1:
+        # θ is an isomorphism on the units ≡ 1 (mod p), and vanishes on
+        # the rest of U_{p^s}
+        modulus = p ** (s - 1)
+        solutions = math_helper.linear_congruence_solutions(
+            math_helper.theta(a, p, s), math_helper.theta(b, p, s), modulus
+        )
+        if solutions is None:
+            return
+        # the solutions x0 + k*step are the single congruence x ≡ x0 (mod step)
+        x0, step, _ = solutions
+        congruences.append((x0, step))
+    return congruences
+
+
+def _discrete_log_mod_power_of_2(
+    a: int,
+    b: int,
+    s: int
+) -> Optional[Tuple[int, int]]:
+    """
+    Returns (x, 2^k) for a^x ≡ b (mod 2^s), where 2^k = ord(a) - the bits
+    of x are the logs of (b * a^(-x_i))^(2^(k-1-i)) in {1, a^(2^(k-1))}.
+    """
+    modulus = 2 ** s
+    a, b = a % modulus, b % modulus
+    # ord(a) = 2^k is found by squaring
+    k, power = 0, a
+    while power != 1:
+        power = power * power % modulus
+        k += 1
+
+    gamma = pow(a, 2 ** (k - 1), modulus) if k > 0 else 1
+    x = 0
+    for i in range(k):
+        b_i = pow(b * pow(a, -x, modulus), 2 ** (k - 1 - i), modulus)
+        if b_i == gamma:
+            x += 2 ** i
+        elif b_i != 1:
+            return
+    if pow(a, x, modulus) != b:
+        return
+    return x, 2 ** k
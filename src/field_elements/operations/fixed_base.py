@@ -0,0 +1,166 @@
+from src.field_elements.operations.bsgs_table import powers
+from src.field_elements import (
+    FiniteFieldElement,
+    FiniteFieldElementArray,
+    PrimeFieldElement
+)
+from src.fields import FiniteField
+import common.consts as consts
+
+from typing import List, Union
+import numpy as np
+import sys
+
+
+class FixedBasePowers:
+    """
+    Precomputed powers of a fixed element g, for computing g^e for many
+    different exponents e.
+
+    The exponent (reduced modulo the group order q-1) is split into
+    w-bit digits, e = sum(e_i * 2^(w*i)), and the table holds
+        table[i][j] = g^(j * 2^(w*i)),  0 <= j < 2^w
+    so g^e = prod(table[i][e_i]) - at most log2(q)/w products and no
+    squarings.
+
+    The window w is the largest up to 'window' whose table fits in
+    'max_bytes' (a table of w-bit rows holds ceil(log2(q)/w) * 2^w
+    elements). Prime field generators use GF(p) as a degree 1 field, and
+    'pow' multiplies their powers as python ints.
+
+    Attributes:
+        generator (FiniteFieldElement | PrimeFieldElement): The base g.
+        window (int): The number of exponent bits per table row.
+        table (np.ndarray): The (rows, 2^w, n) array of coefficient vectors
+                            (n = 1 for prime fields).
+    """
+    def __init__(
+        self,
+        generator: Union[FiniteFieldElement, PrimeFieldElement],
+        window: int = consts.FIXED_BASE_MAX_WINDOW,
+        max_bytes: int = consts.FIXED_BASE_MAX_BYTES
+    ) -> None:
+        if isinstance(generator, FiniteFieldElement):
+            field, g = generator.field, generator.a
+        elif isinstance(generator, PrimeFieldElement):
+            # GF(p) as the degree 1 extension F_p[x]/(x)
+            field = FiniteField.get(generator.p, [0, 1])
+            g = field.vectors([generator.a])
+        else:
+            raise TypeError(
+                "Expected a 'FiniteFieldElement' or 'PrimeFieldElement', " +
+                f"got {type(generator).__name__}"
+            )
+        if np.all(field.vectors(g) % field.p == 0):
+            raise ValueError("Can't build fixed-base powers of the zero element")
+        if window < 1:
+            raise ValueError(f"The window must be positive, got {window}")
+
+        self._generator = generator
+        self._field = field
+        self._group_order = field.order - 1
+        bits = max(self._group_order.bit_length(), 1)
+        # bytes of a coefficient (and of the python int it points to)
+        coef_bytes = field.dtype.itemsize + (
+            sys.getsizeof(field.p) if field.dtype == object else 0
+        )
+        while window > 1 and (
+            -(-bits // window) * 2**window * field.n * coef_bytes > max_bytes
+        ):
+            window -= 1
+        rows = -(-bits // window)
+        if rows * 2**window * field.n * coef_bytes > max_bytes:
+            raise ValueError(
+                f"Fixed-base tables need more than {max_bytes} bytes"
+            )
+
+        self._window = window
+        self._table = self.build(field, g, window, rows)
+        # prime field powers are multiplied as python ints
+        self._scalars = (
+            self._table[..., 0].tolist()
+            if isinstance(generator, PrimeFieldElement) else None
+        )
+
+    @staticmethod
+    def build(
+        field: FiniteField,
+        g: np.ndarray,
+        window: int,
+        rows: int
+    ) -> np.ndarray:
+        """
+        Row i holds the powers 0..2^w-1 of g_i = g^(2^(w*i)), where
+        g_(i+1) = g_i^(2^w) is the last entry of row i times g_i.
+        """
+        table = np.empty((rows, 2**window, field.n), dtype=field.dtype)
+        base = field.vectors(g)
+        for i in range(rows):
+            table[i] = powers(field, base, 2**window)
+            base = field.mul_vectors(table[i, -1], base)
+        table.setflags(write=False)
+        return table
+
+    @property
+    def generator(self) -> Union[FiniteFieldElement, PrimeFieldElement]:
+        return self._generator
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    @property
+    def table(self) -> np.ndarray:
+        return self._table
+
+    def pow(self, e: int) -> Union[FiniteFieldElement, PrimeFieldElement]:
+        """Computes g^e (negative exponents included)."""
+        e %= self._group_order
+        mask = 2**self._window - 1
+        if self._scalars is not None:
+            p = self._field.p
+            result = self._scalars[0][e & mask]
+            for row in self._scalars[1:]:
+                e >>= self._window
+                if e == 0:
+                    break
+                result = result * row[e & mask] % p
+            return PrimeFieldElement._from_int(int(result), p)
+
+        result = self._table[0, e & mask]
+        for i in range(1, len(self._table)):
+            e >>= self._window
+            if e == 0:
+                break
+            digit = e & mask
+            if digit:
+                result = self._field.mul_vectors(result, self._table[i, digit])
+        return FiniteFieldElement._from_field(result, self._field)
+
+    def pow_many(
+        self,
+        exponents: Union[np.ndarray, List[int]]
+    ) -> Union[FiniteFieldElementArray, np.ndarray]:
+        """
+        Computes g^e for every exponent - one vectorized product per table
+        row. Returns a 'FiniteFieldElementArray' for an extension field
+        generator, and the array of values mod p for a 'PrimeFieldElement'.
+        """
+        # python ints (lists may hold exponents beyond int64), reduced to
+        # int64 when the group order allows it
+        if not isinstance(exponents, np.ndarray) or self._group_order >= 2**63:
+            exponents = np.asarray(exponents, dtype=object)
+        e = exponents % self._group_order
+        if self._group_order < 2**63:
+            e = e.astype(np.int64)
+        mask = 2**self._window - 1
+        result = self._table[0, (e & mask).astype(np.int64)]
+        for i in range(1, len(self._table)):
+            e = e >> self._window
+            result = self._field.mul_vectors(
+                result, self._table[i, (e & mask).astype(np.int64)]
+            )
+
+        if isinstance(self._generator, PrimeFieldElement):
+            return result[..., 0]
+        return FiniteFieldElementArray._from_field(result, self._field)
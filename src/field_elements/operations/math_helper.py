@@ -1,6 +1,10 @@
+from src.fields.operations import factor_helper
 import common.log.logging_handler as log
+import common.consts as consts
 
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional, Union
+from math import isqrt, prod
+import numpy as np
 
 
 def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
@@ -36,6 +40,75 @@ def modinv(a: int, m: int) -> Optional[int]:
     return x % m
 
 
+def batch_modinv(
+    values: Union[np.ndarray, List[int]],
+    m: int
+) -> Optional[np.ndarray]:
+    """
+    Compute the modular inverses of an array of values modulo a shared m.
+    The Extended Euclidean Algorithm runs on all the values at once, one
+    (vectorized) division step per iteration - O(log m) array operations
+    instead of a Python loop per value.
+    The result is an int64 array when m < 2^62 (the Bezout coefficients
+    stay below m), and an object array of Python ints otherwise.
+    Returns None and prints error message if an inverse does not exist.
+    """
+    dtype = np.int64 if m < consts.INT64_SAFE_MODULUS else object
+    values = _as_int_array(values, dtype)
+    old_r = (values % m).astype(dtype)
+    r = np.full(old_r.shape, m, dtype=dtype)
+    old_x = np.ones(old_r.shape, dtype=dtype)
+    x = np.zeros(old_r.shape, dtype=dtype)
+
+    active = r != 0
+    while np.any(active):
+        q = np.where(active, old_r // np.where(active, r, 1), 0)
+        old_r, r = np.where(active, r, old_r), np.where(active, old_r - q * r, r)
+        old_x, x = np.where(active, x, old_x), np.where(active, old_x - q * x, x)
+        active = r != 0
+
+    missing = np.flatnonzero(old_r != 1)
+    if len(missing) > 0:
+        value = values.reshape(-1)[missing[0]]
+        log.error(f"No inverse for {value} modulo {m}")
+        return
+    return (old_x % m).astype(dtype)
+
+
+def _as_int_array(
+    values: Union[np.ndarray, List[int]],
+    dtype: type
+) -> np.ndarray:
+    """
+    Converts integers to an array for the 'dtype' arithmetic. Lists (and
+    the object path) go through python ints - numpy turns lists holding
+    values of 2^63 and above into float64 or uint64 arrays.
+    """
+    if not isinstance(values, np.ndarray) or dtype is object:
+        return np.asarray(values, dtype=object)
+    return values
+
+
+def linear_congruence_solutions(
+    a: int,
+    b: int,
+    m: int
+) -> Optional[Tuple[int, int, int]]:
+    """
+    Solves a*x ≡ b (mod m). With g = gcd(a, m) there are no solutions
+    if g does not divide b, otherwise there are exactly g solutions:
+    x0 + k*(m/g) for k = 0, ..., g-1.
+    Returns (x0, m/g, g), or None if there are no solutions - g may be
+    as large as m, so the solutions are left to the caller to enumerate.
+    """
+    g, x, _ = extended_gcd(a % m, m)
+    if b % g != 0:
+        return
+    step = m // g
+    x0 = (x * (b // g)) % step
+    return x0, step, g
+
+
 def chinese_remainder_theorem(
     a1: int,
     m1: int,
@@ -64,6 +137,93 @@ def chinese_remainder_theorem(
     return x
 
 
+def chinese_remainder_theorem_general(
+    residues: List[int],
+    moduli: List[int]
+) -> Optional[int]:
+    """
+    Solve the system x ≡ a_i (mod m_i) for any number of congruences.
+    The moduli don't have to be pairwise coprime - congruences are merged
+    one at a time, and None is returned if the system is inconsistent.
+    The solution is unique modulo lcm(m_1, ..., m_k).
+    """
+    x, m = 0, 1
+    for a_i, m_i in zip(residues, moduli):
+        # x + m*t ≡ a_i (mod m_i)  =>  m*t ≡ a_i - x (mod m_i)
+        g, inv, _ = extended_gcd(m % m_i, m_i)
+        if (a_i - x) % g != 0:
+            log.error(
+                f"Inconsistent congruences: x ≡ {x} (mod {m}), " +
+                f"x ≡ {a_i} (mod {m_i})"
+            )
+            return
+        t = ((a_i - x) // g * inv) % (m_i // g)
+        x, m = x + m * t, m * (m_i // g)
+        x %= m
+    return x
+
+
+def garner_constants(moduli: List[int]) -> Optional[List[int]]:
+    """
+    Precomputes the constants of Garner's algorithm for pairwise coprime
+    moduli: c_i = (m_0 * ... * m_(i-1))^(-1) (mod m_i). They depend on the
+    moduli only, so they are reused across all the residue vectors.
+    """
+    constants = []
+    for i, m_i in enumerate(moduli):
+        c_i = modinv(prod(moduli[:i]) % m_i, m_i)
+        if c_i is None:
+            log.error(f"Garner's algorithm requires coprime moduli: {moduli}")
+            return
+        constants.append(c_i)
+    return constants
+
+
+def chinese_remainder_theorem_garner(
+    residues: Union[np.ndarray, List[List[int]]],
+    moduli: List[int],
+    constants: Optional[List[int]] = None
+) -> Optional[np.ndarray]:
+    """
+    Solve x ≡ r_i (mod m_i) for pairwise coprime moduli m_0, ..., m_(k-1),
+    for a whole array of residue vectors (shape (..., k)) at once.
+
+    Garner's algorithm finds the mixed-radix digits of x:
+        x = v_0 + v_1*m_0 + v_2*m_0*m_1 + ...
+        v_i = (r_i - (v_0 + v_1*m_0 + ...)) * c_i  (mod m_i)
+    so every digit costs a few array operations modulo m_i (and no big
+    integer arithmetic). The constants c_i (see 'garner_constants') may be
+    passed in to reuse them between calls.
+    The result (shape (...)) is an int64 array when the products fit
+    (all m_i < 2^31 and m_0*...*m_(k-1) < 2^63), and an object array of
+    Python ints otherwise.
+    """
+    if constants is None:
+        constants = garner_constants(moduli)
+        if constants is None:
+            return
+
+    small = (
+        max(moduli) < consts.INT64_SAFE_MUL_MODULUS and
+        prod(moduli) < 2**63
+    )
+    dtype = np.int64 if small else object
+    residues = _as_int_array(residues, dtype)
+    residues = (residues % np.array(moduli, dtype=residues.dtype)).astype(dtype)
+    digits = []
+    for i, (m_i, c_i) in enumerate(zip(moduli, constants)):
+        # v_0 + v_1*m_0 + ... + v_(i-1)*m_0*...*m_(i-2) (mod m_i), Horner
+        partial = np.zeros(residues.shape[:-1], dtype=dtype)
+        for j in range(i - 1, -1, -1):
+            partial = (partial * (moduli[j] % m_i) + digits[j]) % m_i
+        digits.append((residues[..., i] - partial) % m_i * c_i % m_i)
+
+    x = np.zeros(residues.shape[:-1], dtype=dtype)
+    for j in range(len(moduli) - 1, -1, -1):
+        x = x * moduli[j] + digits[j]
+    return x
+
+
 def theta(k: int, p: int, s: int) -> int:
     """
     Computes the homomorphism θ from U_{p^s} to Z⁺_{p^(s-1)}:
@@ -81,11 +241,105 @@ def theta(k: int, p: int, s: int) -> int:
 
 def discrete_log_mod_p(a: int, b: int, p: int) -> Optional[int]:
     """
-    Solve a^x ≡ b (mod p) for x, where p is small.
-    Returns x in the range [0, p-2] (since the multiplicative group mod p has order p-1).
-    This uses a simple brute-force search.
+    Solve a^x ≡ b (mod p) for x.
+    Returns the smallest such x, in the range [0, p-2] (since the
+    multiplicative group mod p has order p-1).
+    Primes up to DISCRETE_LOG_SCAN_MAX_P are scanned (one multiplication
+    per candidate). Larger primes use Pohlig-Hellman on the order of a
+    (a divisor of p-1), with a dict based BSGS in every subgroup of prime
+    order r - O(sqrt(r)) per subgroup instead of O(p) in total.
     """
-    for x in range(p - 1):
-        if pow(a, x, p) == b % p:
+    a, b = a % p, b % p
+    if b == 1:
+        return 0
+    if a != 0 and b != 0:
+        if p <= consts.DISCRETE_LOG_SCAN_MAX_P:
+            x = _discrete_log_scan_mod_p(a, b, p)
+        else:
+            x = _discrete_log_pohlig_hellman_mod_p(a, b, p)
+        if x is not None:
             return x
     log.error("Discrete logarithm not found mod p")
+
+
+def multiplicative_order_mod_p(a: int, p: int) -> int:
+    """
+    Returns the order of a non-zero a modulo a prime p: starting from p-1,
+    every prime factor r is stripped while a^(order/r) ≡ 1 (mod p).
+    """
+    order = p - 1
+    for prime, exp in factor_helper.factorize(p - 1).items():
+        for _ in range(exp):
+            if pow(a, order // prime, p) != 1:
+                break
+            order //= prime
+    return order
+
+
+def _discrete_log_scan_mod_p(a: int, b: int, p: int) -> Optional[int]:
+    power = 1
+    for x in range(p - 1):
+        if power == b:
+            return x
+        power = power * a % p
+
+
+def _discrete_log_pohlig_hellman_mod_p(a: int, b: int, p: int) -> Optional[int]:
+    """Pohlig-Hellman modulo p, over the factorization of ord(a)."""
+    order = multiplicative_order_mod_p(a, p)
+    residues, moduli = [], []
+    for prime, exp in factor_helper.factorize(order).items():
+        x_k = discrete_log_prime_power_mod_p(a, b, p, order, prime, exp)
+        if x_k is None:
+            return
+        residues.append(x_k)
+        moduli.append(prime**exp)
+
+    x = chinese_remainder_theorem_general(residues, moduli)
+    # b may be outside the subgroup generated by a
+    if x is not None and pow(a, x, p) == b:
+        return x
+
+
+def discrete_log_prime_power_mod_p(
+    a: int,
+    b: int,
+    p: int,
+    order: int,
+    prime: int,
+    exp: int
+) -> Optional[int]:
+    """
+    Finds x mod prime^exp, where a^x ≡ b (mod p) and prime^exp divides
+    order = ord(a). x = d0 + d1*r + ... is found digit by digit - d_k is
+    the log of (b * a^(-x_k))^(N/r^(k+1)) to the base a^(N/r), of order r.
+    """
+    gamma = pow(a, order // prime, p)
+    x_k = 0
+    for k in range(exp):
+        b_k = pow(b * pow(a, -x_k, p), order // prime**(k + 1), p)
+        d_k = _bsgs_mod_p(gamma, b_k, p, prime)
+        if d_k is None:
+            return
+        x_k += d_k * prime**k
+    return x_k
+
+
+def _bsgs_mod_p(a: int, b: int, p: int, order: int) -> Optional[int]:
+    """BSGS modulo p, for an a of the given order."""
+    m = isqrt(order - 1) + 1
+    # baby steps {a^j: j}, one multiplication each (smallest j is kept)
+    table = {}
+    power = 1
+    for j in range(m):
+        table.setdefault(power, j)
+        power = power * a % p
+
+    # giant steps b * a^(-mi), each one an O(1) lookup
+    factor = pow(a, -m, p)
+    gamma = b
+    for i in range(m):
+        j = table.get(gamma)
+        if j is not None:
+            return i*m + j
+        gamma = gamma * factor % p
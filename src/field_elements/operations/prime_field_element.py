@@ -0,0 +1,292 @@
+from src.field_elements.operations import math_helper
+from src.field_elements import PrimeFieldElement
+from src.fields.operations import factor_helper
+import common.log.logging_handler as log
+import common.consts as consts
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+import random
+import math
+import multiprocessing
+
+
+# a relation g^k = prod(b_j^(e_j)) (mod p), as (k, {j: e_j})
+Relation = Tuple[int, Dict[int, int]]
+
+
+def discrete_log_index_calculus(
+    h: Union[int, PrimeFieldElement],
+    generator: PrimeFieldElement,
+    workers: int = 1,
+    seed: Optional[int] = None
+) -> Optional[int]:
+    """
+    Implements the index calculus algorithm for solving the discrete
+    logarithm problem in a prime field GF(p), in sub-exponential time.
+
+    1. Factor base: the primes up to B = exp(c*sqrt(ln p * ln ln p)).
+    2. Relations: random k such that g^k mod p is B-smooth give
+       k ≡ sum(e_j * log(b_j)) (mod p-1). Candidates are tested for
+       smoothness with a single modular exponentiation (g^k mod p is
+       B-smooth iff it divides P^e, P the product of the factor base),
+       and split across 'workers' processes.
+    3. Linear algebra: the system is solved modulo every prime power r^e
+       of p-1 whose prime r is above INDEX_CALCULUS_SMALL_PRIME_MAX, by
+       sparse Gaussian elimination. Logs modulo the small prime powers
+       are found directly with Pohlig-Hellman.
+    4. Descent: a random k such that h*g^k is B-smooth gives
+       log(h) = sum(e_j * log(b_j)) - k.
+    The residues are combined with the Chinese Remainder Theorem.
+
+    Args:
+        h: The target element for which the discrete log is computed.
+        generator: A generator of the multiplicative group of GF(p).
+        workers: Number of processes collecting relations.
+        seed: Seed of the random exponents (for reproducible runs).
+
+    Returns:
+        The discrete logarithm x such that g^x = h, or None if an error occurs.
+    """
+    if generator is None:
+        log.error("Got None generator for 'discrete_log_index_calculus")
+        return
+
+    p = generator.p
+    if isinstance(h, PrimeFieldElement):
+        h = h.a
+    g, h = int(generator.a) % p, int(h) % p
+    order = p - 1
+    if h == 0:
+        log.error("Got the zero element, which has no discrete logarithm")
+        return
+    if g == 0 or math_helper.multiplicative_order_mod_p(g, p) != order:
+        log.error(f"index calculus requires a generator of GF({p})^*, got {g}")
+        return
+
+    rng = random.Random(seed)
+    residues, moduli = [], []
+    large_moduli = []
+    for prime, exp in factor_helper.factorize(order).items():
+        if prime <= consts.INDEX_CALCULUS_SMALL_PRIME_MAX:
+            x = math_helper.discrete_log_prime_power_mod_p(
+                g, h, p, order, prime, exp
+            )
+            if x is None:
+                log.error(f"No discrete logarithm found modulo {prime}^{exp}")
+                return
+            residues.append(x)
+            moduli.append(prime**exp)
+        else:
+            large_moduli.append(prime**exp)
+
+    if large_moduli:
+        factor_base = _factor_base(p)
+        base_logs = _factor_base_logs(
+            p, g, factor_base, large_moduli, workers, rng
+        )
+        if base_logs is None:
+            log.error("index calculus failed to solve the factor base logs")
+            return
+        k, exps = _descent(p, g, h, factor_base, base_logs, rng)
+        for modulus, logs in zip(large_moduli, base_logs):
+            residues.append(
+                (sum(e * logs[j] for j, e in exps.items()) - k) % modulus
+            )
+            moduli.append(modulus)
+
+    x = math_helper.chinese_remainder_theorem_general(residues, moduli)
+    if x is None or pow(g, x, p) != h:
+        log.error(f"No discrete logarithm found for the given element")
+        return
+    return x
+
+
+def _factor_base(p: int) -> List[int]:
+    """The primes up to B = exp(c*sqrt(ln p * ln ln p)) (sieve)."""
+    ln_p = math.log(p)
+    bound = int(math.exp(
+        consts.INDEX_CALCULUS_BOUND_EXPONENT * math.sqrt(ln_p * math.log(ln_p))
+    ))
+    bound = max(bound, consts.INDEX_CALCULUS_MIN_BOUND)
+    sieve = np.ones(bound + 1, dtype=bool)
+    sieve[:2] = False
+    for i in range(2, math.isqrt(bound) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = False
+    return np.flatnonzero(sieve).tolist()
+
+
+def _factor_base_logs(
+    p: int,
+    g: int,
+    factor_base: List[int],
+    moduli: List[int],
+    workers: int,
+    rng: random.Random
+) -> Optional[List[List[Optional[int]]]]:
+    """
+    Collects relations and solves log(b_j) modulo each of the moduli.
+    Primes missing from the relations keep an unknown (None) log - more
+    relations are collected while less than INDEX_CALCULUS_MIN_SOLVED of
+    the factor base is solved.
+    """
+    relations = []
+    needed = len(factor_base) + consts.INDEX_CALCULUS_EXTRA_RELATIONS
+    for _ in range(consts.INDEX_CALCULUS_MAX_ROUNDS):
+        relations += _collect_relations(
+            p, g, factor_base, needed - len(relations), workers, rng
+        )
+        solutions = [
+            _solve_relations(relations, len(factor_base), modulus)
+            for modulus in moduli
+        ]
+        solved = sum(
+            all(logs[j] is not None for logs in solutions)
+            for j in range(len(factor_base))
+        )
+        if solved >= consts.INDEX_CALCULUS_MIN_SOLVED * len(factor_base):
+            return solutions
+        needed += len(factor_base) // 10 + consts.INDEX_CALCULUS_EXTRA_RELATIONS
+
+
+def _collect_relations(
+    p: int,
+    g: int,
+    factor_base: List[int],
+    count: int,
+    workers: int,
+    rng: random.Random
+) -> List[Relation]:
+    if workers <= 1:
+        return _relations_worker(p, g, factor_base, count, rng.getrandbits(64))
+
+    # every process collects its share, with its own random stream
+    counts = [count // workers + (i < count % workers) for i in range(workers)]
+    seeds = [rng.getrandbits(64) for _ in range(workers)]
+    # workers are forked from a clean server process (with this module
+    # preloaded) - forking this process, which may already run native
+    # thread pools (numba, BLAS), can deadlock
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context
+    ) as executor:
+        chunks = executor.map(
+            _relations_worker,
+            [p] * workers, [g] * workers, [factor_base] * workers, counts, seeds
+        )
+        return [relation for chunk in chunks for relation in chunk]
+
+
+def _relations_worker(
+    p: int,
+    g: int,
+    factor_base: List[int],
+    count: int,
+    seed: int
+) -> List[Relation]:
+    """Finds 'count' relations g^k = prod(b_j^(e_j)) (mod p)."""
+    rng = random.Random(seed)
+    base_product = math.prod(factor_base)
+    relations = []
+    while len(relations) < count:
+        k = rng.randrange(1, p - 1)
+        exps = _factor_smooth(pow(g, k, p), factor_base, base_product)
+        if exps is not None:
+            relations.append((k, exps))
+    return relations
+
+
+def _descent(
+    p: int,
+    g: int,
+    h: int,
+    factor_base: List[int],
+    base_logs: List[List[Optional[int]]],
+    rng: random.Random
+) -> Tuple[int, Dict[int, int]]:
+    """Finds k such that h*g^k = prod(b_j^(e_j)) (mod p), for known logs."""
+    base_product = math.prod(factor_base)
+    while True:
+        k = rng.randrange(p - 1)
+        exps = _factor_smooth(h * pow(g, k, p) % p, factor_base, base_product)
+        if exps is not None and all(
+            logs[j] is not None for logs in base_logs for j in exps
+        ):
+            return k, exps
+
+
+def _factor_smooth(
+    v: int,
+    factor_base: List[int],
+    base_product: int
+) -> Optional[Dict[int, int]]:
+    """Factors v over the factor base, None if v is not smooth."""
+    # v is smooth iff P^e ≡ 0 (mod v) for P = prod(factor base) and
+    # e = bits(v) - the trial division below only runs for the (rare)
+    # smooth values
+    if pow(base_product, v.bit_length(), v) != 0:
+        return
+    exps = {}
+    for j, prime in enumerate(factor_base):
+        while v % prime == 0:
+            v //= prime
+            exps[j] = exps.get(j, 0) + 1
+        if v == 1:
+            return exps
+
+
+def _solve_relations(
+    relations: List[Relation],
+    size: int,
+    modulus: int
+) -> List[Optional[int]]:
+    """
+    Solves sum(e_j * log(b_j)) ≡ k (mod modulus) for the logs of the
+    factor base, by sparse Gaussian elimination. Columns are eliminated
+    from the largest prime down (the large primes appear in few relations,
+    so the fill-in stays small), with pivots that are units mod modulus.
+    Logs that the relations do not determine are None.
+    """
+    rows = [
+        ({j: e % modulus for j, e in exps.items() if e % modulus}, k % modulus)
+        for k, exps in relations
+    ]
+    pivots = []
+    for col in range(size - 1, -1, -1):
+        candidates = [
+            i for i, (row, _) in enumerate(rows)
+            if col in row and math.gcd(row[col], modulus) == 1
+        ]
+        if not candidates:
+            continue
+        pivot_idx = min(candidates, key=lambda i: len(rows[i][0]))
+        pivot_row, pivot_rhs = rows.pop(pivot_idx)
+        inv = pow(pivot_row[col], -1, modulus)
+        pivot_row = {j: c * inv % modulus for j, c in pivot_row.items()}
+        pivot_rhs = pivot_rhs * inv % modulus
+        pivots.append((col, pivot_row, pivot_rhs))
+
+        # eliminate 'col' from the remaining rows
+        for i, (row, rhs) in enumerate(rows):
+            factor = row.get(col)
+            if factor is None:
+                continue
+            for j, c in pivot_row.items():
+                value = (row.get(j, 0) - factor * c) % modulus
+                if value:
+                    row[j] = value
+                else:
+                    row.pop(j, None)
+            rows[i] = (row, (rhs - factor * pivot_rhs) % modulus)
+
+    # back substitution - a pivot row only holds columns eliminated later,
+    # and its log is known only if all of theirs are
+    logs = [None] * size
+    for col, row, rhs in reversed(pivots):
+        others = [(j, c) for j, c in row.items() if j != col]
+        if all(logs[j] is not None for j, _ in others):
+            logs[col] = (rhs - sum(c * logs[j] for j, c in others)) % modulus
+    return logs
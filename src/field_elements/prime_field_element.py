@@ -1,10 +1,12 @@
 from src.field_elements import AbstractFieldElement
+from src.fields.operations import factor_helper
 
 import common.log.logging_handler as log
 
-from typing import Union, Optional
-from copy import deepcopy
+from typing import Type, Union, Optional
+from functools import lru_cache
 
+import numpy as np
 import galois
 
 
@@ -19,36 +21,58 @@ class PrimeFieldElement(AbstractFieldElement):
     field properties.
 
     Features:
-    - Ensures elements belong to the prime field using the Galois field library.
-    - Supports exponentiation using efficient exponentiation by squaring.
+    - Stores the element as a plain Python int in [0, p) - the arithmetic
+      is done with '%' and 'pow', without per-element 'galois' objects.
+    - Accepts 'galois.FieldArray' inputs, and exposes the (cached per p)
+      'galois' field class through 'gf_p'.
+    - Supports exponentiation using Python's modular 'pow'.
+    - In-place operators ('+=', '-=', '*=') update the element itself.
     - Computes the multiplicative order of an element.
     - Handles inversion and error cases correctly.
 
     Attributes:
         a_orig (galois.FieldArray | int): The original 'a' value before mod operation.
-        a (galois.FieldArray | int): The field element.
+        a (int): The field element.
         p (int): The prime number defining the field.
     """
+    __slots__ = ()
+
     def __init__(self, a: Union[galois.FieldArray, int], p: int) -> None:
-        super().__init__(p)  
-        self._gf_p = galois.GF(self._p)
+        super().__init__(p)
+        _validate_prime(p)
         self._a_orig = a
         # 'a' represent the element in the field.
-        # can be passed as int or 'galois.FieldArray'.
-        # if 'a' is an int, we create a 'galois.FieldArray'
-        # object using it and assign as the object value of 'a'.
-        if isinstance(a, int):
-            self._a = self._gf_p(a % self._p)
-        elif isinstance(a, galois.FieldArray):
-            self._a = a
+        # can be passed as an int (Python or NumPy) or 'galois.FieldArray',
+        # and is stored as a Python int reduced mod p.
+        if isinstance(a, galois.FieldArray):
+            if type(a).order != p:
+                raise ValueError(
+                    f"Input 'a' is an element of {type(a).name}, not GF({p})"
+                )
+            self._a = int(a)
+        elif isinstance(a, (int, np.integer)):
+            self._a = int(a) % p
         else:
             raise ValueError(
                 "Input 'a' must be of type 'int' or 'galois.FieldArray'"
             )
 
+    @classmethod
+    def _from_int(cls, a: int, p: int) -> "PrimeFieldElement":
+        """
+        Creates an element from an int that is already reduced mod p.
+        Used for operation results - skips the input validation done in
+        '__init__'.
+        """
+        element = cls.__new__(cls)
+        element._p = p
+        element._a = a
+        element._a_orig = a
+        return element
+
     @property
-    def gf_p(self) -> galois.FieldArray:
-        return self._gf_p
+    def gf_p(self) -> Type[galois.FieldArray]:
+        return gf(self._p)
 
     @property
     def order(self) -> int:
@@ -62,85 +86,150 @@ class PrimeFieldElement(AbstractFieldElement):
     # of two objects of the class will be performed.
     def __add__(self, other: "PrimeFieldElement") -> Optional["PrimeFieldElement"]:
         self.type_check(other)
-        # both 'self._a' and 'other.a' are 'galois.FieldArray'.
-        # the 'galois' package handles modular arithmetic.
         try:
-            return PrimeFieldElement(self._a + other.a, self._p)
+            self._field_check(other, "add")
+            a = self._a + other.a
+            return PrimeFieldElement._from_int(
+                a - self._p if a >= self._p else a, self._p
+            )
         except Exception as e:
             log.error(str(e))
 
     def __sub__(self, other: "PrimeFieldElement") -> Optional["PrimeFieldElement"]:
         self.type_check(other)
-        # both 'self._a' and 'other.a' are 'galois.FieldArray'.
-        # the 'galois' package handles modular arithmetic.
         try:
-            return PrimeFieldElement(self._a - other.a, self._p)
+            self._field_check(other, "subtract")
+            a = self._a - other.a
+            return PrimeFieldElement._from_int(
+                a + self._p if a < 0 else a, self._p
+            )
         except Exception as e:
-            log.error(str(e))   
+            log.error(str(e))
 
     def __mul__(self, other: "PrimeFieldElement"):
         self.type_check(other)
-        # both 'self._a' and 'other.a' are 'galois.FieldArray'.
-        # the 'galois' package handles modular arithmetic.
         try:
-            return PrimeFieldElement(self._a * other.a, self._p)
+            self._field_check(other, "multiply")
+            return PrimeFieldElement._from_int(self._a * other.a % self._p, self._p)
         except Exception as e:
             log.error(str(e))
 
     def __truediv__(self, other: "PrimeFieldElement") -> Optional["PrimeFieldElement"]:
         self.type_check(other)
-        # both 'self._a' and 'other.a' are 'galois.FieldArray'.
-        # the 'galois' package handles modular arithmetic.
         try:
-            return PrimeFieldElement(self._a / other.a, self._p)
+            self._field_check(other, "divide")
+            return PrimeFieldElement._from_int(
+                self._a * self._inverse(other.a) % self._p, self._p
+            )
         except Exception as e:
             log.error(str(e))
-    
+
     def __invert__(self) -> Optional["PrimeFieldElement"]:
         try:
-            return PrimeFieldElement(self._a**-1, self._p)
+            return PrimeFieldElement._from_int(self._inverse(self._a), self._p)
         except Exception as e:
             log.error(str(e))
 
+    # IN-PLACE OPERATORS:
+    # 'a += b', 'a -= b' and 'a *= b' update 'a' itself instead of
+    # creating a new element.
+    def __iadd__(self, other: "PrimeFieldElement") -> Optional["PrimeFieldElement"]:
+        self.type_check(other)
+        try:
+            self._field_check(other, "add")
+            a = self._a + other.a
+            return self._assign(a - self._p if a >= self._p else a)
+        except Exception as e:
+            log.error(str(e))
+
+    def __isub__(self, other: "PrimeFieldElement") -> Optional["PrimeFieldElement"]:
+        self.type_check(other)
+        try:
+            self._field_check(other, "subtract")
+            a = self._a - other.a
+            return self._assign(a + self._p if a < 0 else a)
+        except Exception as e:
+            log.error(str(e))
+
+    def __imul__(self, other: "PrimeFieldElement") -> Optional["PrimeFieldElement"]:
+        self.type_check(other)
+        try:
+            self._field_check(other, "multiply")
+            return self._assign(self._a * other.a % self._p)
+        except Exception as e:
+            log.error(str(e))
+
+    def _assign(self, a: int) -> "PrimeFieldElement":
+        self._a = a
+        self._a_orig = a
+        return self
+
     # we added equality check overload
     def __eq__(self, other: "PrimeFieldElement") -> bool:
         self.type_check(other)
         # verifies same field and element equality
         return self._p == other.p and self._a == other.a
 
+    def _field_check(self, other: "PrimeFieldElement", operation: str) -> None:
+        if self._p != other.p:
+            raise ValueError(
+                f"Operation '{operation}' requires both operands to be " +
+                f"GF({self._p}) elements, not [GF({self._p}), GF({other.p})]."
+            )
+
+    def _inverse(self, a: int) -> int:
+        if a == 0:
+            raise ZeroDivisionError(
+                f"Cannot compute the multiplicative inverse of 0 in GF({self._p})."
+            )
+        return pow(a, -1, self._p)
+
     def get_multiplicative_identity(self) -> Optional["PrimeFieldElement"]:
         """Returns the multiplicative identity element (1) of the prime field."""
-        return PrimeFieldElement(1, self._p)
+        return PrimeFieldElement._from_int(1, self._p)
+
+    def exp_by_squaring(self, n: int) -> Optional["PrimeFieldElement"]:
+        """
+        Computes self^n with Python's modular 'pow' (square-and-multiply
+        on ints). Negative exponents invert the element first.
+        """
+        try:
+            base = self._inverse(self._a) if n < 0 else self._a
+            return PrimeFieldElement._from_int(pow(base, abs(n), self._p), self._p)
+        except Exception as e:
+            log.error(str(e))
 
     def mul_order(self) -> Optional[int]:
         """
         Computes the multiplicative order of 'a' in the prime field.
         The multiplicative order of an element a is the smallest positive
         integer k such that a^k=1(mod p).
-        This function iteratively computes a^k by multiplying self._a
-        (representation of the element in the field) until it cycles
-        back to 1.
+        The order divides p-1, so starting from k=p-1 every prime factor r
+        of p-1 (the factorization is cached per p) is stripped while
+        a^(k/r)=1(mod p), using fast modular exponentiation.
         """
         if self._a == 0:
             log.error("a is zero, not in the prime field")
             return
 
-        # self._a can be int or galois.FieldArray.
-        # if its a galois.FieldArray, a deepcopy is needed to 
-        # avoid changing self._a while searching the mul_order
-        result = (
-            self._a if isinstance(self._a, int)
-            else deepcopy(self._a)
-        )
+        a = self._a
+        order = self._p - 1
+        for prime, exp in factor_helper.factorize(order).items():
+            for _ in range(exp):
+                if pow(a, order // prime, self._p) != 1:
+                    break
+                order //= prime
+        return order
 
-        max_order = self._p - 1
-        for pow in range(1, max_order + 1, 1):
-        # while result != 1:
-            if result == 1:
-                return pow
-            result = result*self._a
 
-        log.error(
-            "multiplicative order not found, " +
-            "possible issue with element or field properties."
-        )
+@lru_cache(maxsize=None)
+def gf(p: int) -> Type[galois.FieldArray]:
+    """The 'galois' class of GF(p), created once per p."""
+    return galois.GF(p)
+
+
+@lru_cache(maxsize=None)
+def _validate_prime(p: int) -> None:
+    # cached, so creating elements of a known field skips the primality test
+    if not factor_helper.is_prime(p):
+        raise ValueError(f"p is not a prime! p: {p}")
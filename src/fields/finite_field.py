@@ -1,6 +1,9 @@
+from src.fields.operations import factor_helper, kernels, poly_helper
+from src.fields.log_tables import LogTables
 import common.consts as consts
 
-from typing import List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 
 
@@ -10,29 +13,123 @@ class FiniteField:
     defined by an irreducible polynomial f(x) of degree n over F_p.
 
     This class provides:
-    - Validation to check if the given polynomial is irreducible (for n=2,3).
+    - Validation to check if the given polynomial is irreducible (Rabin's
+      test, for every degree n).
     - Methods to compute the embedding of the field into the general linear
       group GL_n.
     - Storage of key properties such as the prime characteristic (p), 
       the irreducible polynomial (f(x)), and the dimension (n).
+    - Lazily built discrete log (Zech) tables for small fields, used by the
+      field elements for inversion, division and multiplicative orders
+      (can be turned off per field with 'use_log_tables').
+    - Multiplication of coefficient vectors: a polynomial product followed
+      by a reduction mod f(x), using precomputed x^n, ..., x^(2n-2) mod f(x).
+    - Inversion of coefficient vectors over F_p: extended Euclid modulo f(x)
+      for small degrees, and Itoh-Tsujii (Frobenius chain) for larger ones.
+    - The Frobenius automorphism a -> a^(p^i) as a cached n x n matrix over
+      F_p, used for the norm, for inversion, and for powering with large
+      exponents (e in base p, see 'pow_vectors').
+    - Exact integer arithmetic for every p: coefficient vectors are int64
+      arrays for p < 2^62 (products that may overflow are reduced per term,
+      split into limbs, or computed on python ints) and object arrays of
+      python ints for larger primes.
+    - Compiled (numba) kernels for the vector arithmetic when p < 2^62 and
+      numba is installed - the NumPy implementation is the fallback.
+    - The factorization of the multiplicative group order p^n - 1, shared
+      by the order computations of the field elements.
+
+    A field is immutable once created, so a single instance is shared by
+    every element that lives in it. 'FiniteField.get' interns fields by
+    (p, f(x)), which means validation and the GL_n basis are computed only
+    once per field.
 
     Attributes:
         p (int): The prime number defining the finite field.
         fx (np.ndarray): The irreducible polynomial defining the 
                          field extension.
     """
+    # registry of validated fields, keyed by (p, f(x) coefficients)
+    _REGISTRY: Dict[Tuple[int, Tuple[int, ...]], "FiniteField"] = {}
+
     def __init__(self, p: int, fx: List[int]) -> None:
         # corresponding prime field k
         self._p = p
-        # irreducible polynomia
-        self._fx = (
-            fx if isinstance(fx, np.ndarray)
-            else np.array(fx)
-        )
+        # irreducible polynomia (python ints for large primes - numpy would
+        # otherwise read coefficients above 2^63 as floats)
+        self._fx = np.array(fx, dtype=poly_helper.coefficient_dtype(p))
+        # the field is shared between elements, so its data is read only
+        self._fx.setflags(write=False)
         # polynomia degree
         self._n = len(fx) - 1
+        self._validate_prime()
+        # dtype of the coefficient vectors (see 'vectors')
+        self._dtype = poly_helper.coefficient_dtype(p)
+        # f(x) divided by its leading coefficient - arithmetic is done
+        # modulo the monic polynomial (both define the same field).
+        # a zero leading coefficient is read as 1 (as the GL_n embedding
+        # always did), e.g. fx=[1, 0] for the prime field itself.
+        leading = int(self._fx[-1]) % p
+        self._monic_fx = np.append(
+            poly_helper.scale(
+                self._fx[:-1].astype(self._dtype), pow(leading or 1, -1, p), p
+            ),
+            1
+        ).astype(self._dtype)
         self._validate_irreducible()
-        self._span = self.embedding_GLn()
+        # row i holds x^(n+i) mod f(x), for 0 <= i <= n-2
+        self._reduction_table = self._build_reduction_table()
+        self._reduction_table.setflags(write=False)
+        # arithmetic runs in the compiled kernels when they are available
+        # (for int64 coefficients)
+        self._use_kernels = (
+            kernels.NUMBA_AVAILABLE and self._dtype == np.int64
+        )
+        # GL_n basis - built on first use (see 'span')
+        self._span = None
+        # matrices of the Frobenius powers a -> a^(p^i), built on demand
+        self._frobenius_matrices = {}
+        # p^0, p^1, ..., p^(n-1) - used to encode elements as integers
+        # (python ints once the codes no longer fit in int64)
+        self._code_powers = np.array(
+            [p**i for i in range(self._n)],
+            dtype=np.int64 if self.order < 2**63 else object
+        )
+        self._code_powers.setflags(write=False)
+        # factorization of p^n - 1 - computed on first use
+        self._order_factors = None
+        # built on first use (see 'log_tables')
+        self._log_tables = None
+        self._log_tables_built = False
+        self._use_log_tables = True
+        # first validated instance is the one handed out by 'get'
+        FiniteField._REGISTRY.setdefault(self.key(p, fx), self)
+
+    @classmethod
+    def get(cls, p: int, fx: List[int]) -> "FiniteField":
+        """
+        Returns the shared field instance for (p, f(x)), creating (and
+        validating) it only on first use.
+        """
+        field = cls._REGISTRY.get(cls.key(p, fx))
+        if field is None:
+            field = cls(p, fx)
+        return field
+
+    @staticmethod
+    def key(p: int, fx: List[int]) -> Tuple[int, Tuple[int, ...]]:
+        """Returns the registry key of a field: (p, f(x) coefficients)."""
+        return int(p), tuple(int(c) for c in fx)
+
+    # fields are immutable - copies (e.g. when an element is deep-copied)
+    # and unpickled objects resolve back to the shared instance.
+    def __copy__(self) -> "FiniteField":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FiniteField":
+        return self
+
+    def __reduce__(self) -> tuple:
+        return FiniteField.get, (self._p, self._fx.tolist())
 
     @property
     def p(self) -> int:
@@ -48,17 +145,419 @@ class FiniteField:
 
     @property
     def span(self) -> np.ndarray:
+        if self._span is None:
+            self._span = self.embedding_GLn()
+            self._span.setflags(write=False)
         return self._span
 
-    def _validate_irreducible(self) -> None:
-        """Checks that f(x) is indeed irreducible (only for degrees 2/3)"""
-        if self._n in consts.REDUCIBLE_DEGREES:
-            for i in range(self._p):
-              root = np.polyval(self._fx[::-1], i) % self._p 
-              if root == 0:
-                  raise ValueError(
-                      f"fx is reducible! degree: {self._n}, root: {i}"
+    @property
+    def reduction_table(self) -> np.ndarray:
+        return self._reduction_table
+
+    @property
+    def dtype(self) -> np.dtype:
+        """dtype of the coefficient vectors (int64, or object for large p)."""
+        return self._dtype
+
+    @property
+    def use_kernels(self) -> bool:
+        """Whether the arithmetic runs in the compiled kernels."""
+        return self._use_kernels
+
+    @property
+    def code_powers(self) -> np.ndarray:
+        """[p^0, p^1, ..., p^(n-1)] - the weights of the element codes."""
+        return self._code_powers
+
+    @property
+    def order(self) -> int:
+        """Number of elements in the field (p^n)."""
+        return self._p**self._n
+
+    @property
+    def order_factors(self) -> Dict[int, int]:
+        """
+        Prime factorization {prime: exponent} of the multiplicative group
+        order p^n - 1, computed on first use.
+        """
+        if self._order_factors is None:
+            self._order_factors = factor_helper.factorize(self.order - 1)
+        return self._order_factors
+
+    @property
+    def use_log_tables(self) -> bool:
+        """Whether the elements may use the field's log tables."""
+        return self._use_log_tables
+
+    @use_log_tables.setter
+    def use_log_tables(self, value: bool) -> None:
+        self._use_log_tables = bool(value)
+
+    @property
+    def log_tables(self) -> Optional[LogTables]:
+        """
+        Discrete log tables of the field, built on first access.
+        None if 'use_log_tables' is off, or if the tables exceed
+        'LOG_TABLES_MAX_BYTES' (or could not be built) - elements then
+        fall back to the vector arithmetic.
+        """
+        if not self._use_log_tables:
+            return None
+        if not self._log_tables_built:
+            self._log_tables_built = True
+            if LogTables.nbytes(self.order) <= consts.LOG_TABLES_MAX_BYTES:
+                try:
+                    self._log_tables = LogTables.build(self)
+                except ValueError:
+                    self._log_tables = None
+        return self._log_tables
+
+    def encode(self, a: np.ndarray) -> int:
+        """Encodes coefficients as the integer a0 + a1*p + ... (p-adic)."""
+        return int(self.vectors(a) @ self._code_powers)
+
+    def decode(self, code: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Returns the coefficients of an element encoded by 'encode'
+        (written to 'out' when given).
+        """
+        if out is None:
+            return ((code // self._code_powers) % self._p).astype(self._dtype)
+        np.floor_divide(code, self._code_powers, out=out)
+        np.mod(out, self._p, out=out)
+        return out
+
+    def vectors(self, a: np.ndarray) -> np.ndarray:
+        """
+        Converts coefficients to the field's dtype: int64 for p < 2^62, and
+        python ints (object arrays) for larger primes.
+        """
+        return np.asarray(a, dtype=self._dtype)
+
+    def dot(self, a: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """
+        Computes (a @ matrix) mod p exactly - in int64 when the sums of
+        products fit, and on python ints otherwise.
+        """
+        a, matrix = self.vectors(a), self.vectors(matrix)
+        if (
+            self._p <= consts.INT64_SAFE_MUL_MODULUS and
+            matrix.shape[0] * (self._p - 1)**2 < 2**63
+        ):
+            return a @ matrix % self._p
+        product = a.astype(object) @ matrix.astype(object) % self._p
+        return product.astype(self._dtype)
+
+    def _mul_mod(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Computes (a * b) mod p element-wise, exactly."""
+        if self._p <= consts.INT64_SAFE_MUL_MODULUS:
+            return a * b % self._p
+        product = np.asarray(a).astype(object) * np.asarray(b).astype(object)
+        return (product % self._p).astype(self._dtype)
+
+    def mul_vectors(
+        self,
+        a: np.ndarray,
+        b: np.ndarray,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Multiplies coefficient vectors of field elements.
+        a and b are integer arrays of shape (..., n) (broadcast against each
+        other), the result holds the coefficients of the products mod p.
+        The product is computed in O(n^2): a schoolbook polynomial product
+        (of degree <= 2n-2), then the coefficients of x^n..x^(2n-2) are
+        folded back using the reduction table. Products of coefficients
+        are reduced one by one when their sums could overflow int64.
+        The result is written to 'out' when given (which may alias a or b).
+        """
+        a, b = self.vectors(a), self.vectors(b)
+        if self._use_kernels:
+            if a.ndim == 1 and b.ndim == 1:
+                if out is None:
+                    return kernels.mul(a, b, self._reduction_table, self._p)
+                kernels.mul_to(a, b, self._reduction_table, self._p, out)
+                return out
+            shape = np.broadcast_shapes(a.shape, b.shape)
+            a = np.broadcast_to(a, shape).reshape(-1, self._n)
+            b = np.broadcast_to(b, shape).reshape(-1, self._n)
+            result = kernels.mul_batch(
+                a, b, self._reduction_table, self._p
+            ).reshape(shape)
+            if out is None:
+                return result
+            out[...] = result
+            return out
+
+        lazy = (
+            self._p <= consts.INT64_SAFE_MUL_MODULUS and
+            self._n * (self._p - 1)**2 < 2**63
+        )
+        if a.ndim == 1 and b.ndim == 1 and lazy:
+            product = np.convolve(a, b) % self._p
+        else:
+            shape = np.broadcast_shapes(a.shape, b.shape)[:-1]
+            product = np.zeros(shape + (2*self._n - 1,), dtype=self._dtype)
+            for i in range(self._n):
+                if lazy:
+                    product[..., i:i + self._n] += a[..., i:i + 1] * b
+                else:
+                    product[..., i:i + self._n] = (
+                        product[..., i:i + self._n] +
+                        self._mul_mod(a[..., i:i + 1], b)
+                    ) % self._p
+            product %= self._p
+        if out is None:
+            return self.reduce(product)
+        out[...] = self.reduce(product)
+        return out
+
+    def inv_vectors(self, a: np.ndarray) -> np.ndarray:
+        """
+        Inverts coefficient vectors of non-zero field elements (shape
+        (..., n)). In fields of degree < ITOH_TSUJII_MIN_DEGREE, a single
+        vector (or, in the compiled kernels, every row of a batch) is
+        inverted with the extended Euclidean algorithm. Other batches and
+        fields of a higher degree use the Itoh-Tsujii algorithm.
+        """
+        a = self.vectors(a) % self._p
+        if np.any(np.all(a == 0, axis=-1)):
+            raise ValueError("tried to invert the zero element")
+
+        if self._use_kernels and self._n < consts.ITOH_TSUJII_MIN_DEGREE:
+            if a.ndim == 1:
+                return kernels.inverse(a, self._monic_fx, self._p)
+            result = kernels.inverse_batch(
+                a.reshape(-1, self._n), self._monic_fx, self._p
+            )
+            return result.reshape(a.shape)
+        if self._n == 1:
+            return self._inv_scalars(a)
+        if a.ndim == 1 and self._n < consts.ITOH_TSUJII_MIN_DEGREE:
+            return poly_helper.poly_inverse(a, self._monic_fx, self._p)
+        return self._itoh_tsujii(a)
+
+    def _itoh_tsujii(self, a: np.ndarray) -> np.ndarray:
+        """
+        Itoh-Tsujii inversion. With r = (p^n - 1)/(p - 1):
+        a^(-1) = a^(r-1) * (a^r)^(-1), where a^r (the norm of a) is in F_p,
+        so only a scalar inverse mod p is needed.
+        a^(r-1) = (a^(1 + p + ... + p^(n-2)))^p is computed with an
+        addition chain on b_k = a^(1 + p + ... + p^(k-1)):
+            b_2k = b_k * frob^k(b_k),  b_(k+1) = a * frob(b_k)
+        which takes O(log n) multiplications and Frobenius maps.
+        """
+        a_r_minus_1 = self.frobenius(self._frobenius_chain(a, self._n - 1))
+        norm = self.mul_vectors(a, a_r_minus_1)[..., :1]
+        return self._mul_mod(a_r_minus_1, self._inv_scalars(norm))
+
+    def _frobenius_chain(self, a: np.ndarray, k: int) -> np.ndarray:
+        """Computes b_k = a^(1 + p + ... + p^(k-1)) (k >= 1)."""
+        b, i = a, 1
+        for bit in bin(k)[3:]:
+            b = self.mul_vectors(b, self.frobenius(b, i))
+            i *= 2
+            if bit == "1":
+                b = self.mul_vectors(a, self.frobenius(b))
+                i += 1
+        return b
+
+    def norm(self, a: np.ndarray) -> np.ndarray:
+        """
+        Computes the norms N(a) = a * a^p * ... * a^(p^(n-1)) of coefficient
+        vectors (shape (..., n)) - the values in F_p, of shape (...).
+        """
+        a = self.vectors(a) % self._p
+        return self._frobenius_chain(a, self._n)[..., 0]
+
+    def _inv_scalars(self, c: np.ndarray) -> np.ndarray:
+        """Inverts non-zero elements of F_p (c^(p-2) for arrays)."""
+        if c.size == 1:
+            return np.full_like(c, pow(int(c.flat[0]), -1, self._p))
+
+        result, base, e = np.ones_like(c), c % self._p, self._p - 2
+        while e:
+            if e & 1:
+                result = self._mul_mod(result, base)
+            base = self._mul_mod(base, base)
+            e >>= 1
+        return result
+
+    def frobenius(self, a: np.ndarray, i: int = 1) -> np.ndarray:
+        """
+        Computes a^(p^i) for coefficient vectors (shape (..., n)) - the i-th
+        power of the Frobenius automorphism, a linear map over F_p applied
+        as a matrix (see 'frobenius_matrix').
+        """
+        i %= self._n
+        if i == 0:
+            return self.vectors(a) % self._p
+        return self.dot(a, self.frobenius_matrix(i))
+
+    def frobenius_matrix(self, i: int = 1) -> np.ndarray:
+        """
+        Returns the (read-only) n x n matrix M of a -> a^(p^i) over F_p, that
+        is a^(p^i) = a @ M mod p. Matrices are built on first use and cached.
+        """
+        i %= self._n
+        if i not in self._frobenius_matrices:
+            self._frobenius_matrices[i] = self._build_frobenius_matrix(i)
+        return self._frobenius_matrices[i]
+
+    def _build_frobenius_matrix(self, i: int) -> np.ndarray:
+        """
+        Row j of the matrix is x^(j*p^i) mod f(x): since c^p = c for every
+        c in F_p, (a0 + a1*x + ...)^(p^i) = a0 + a1*x^(p^i) + ...
+        Only the matrix of the Frobenius map itself (i = 1) is built from
+        x^p - its powers are products of cached matrices, M_i = M_j @ M_(i-j).
+        """
+        if i == 0:
+            matrix = np.identity(self._n, dtype=self._dtype)
+        elif i > 1:
+            matrix = self.dot(
+                self.frobenius_matrix(i // 2),
+                self.frobenius_matrix(i - i // 2)
+            )
+        else:
+            x = np.zeros(self._n, dtype=self._dtype)
+            x[min(1, self._n - 1)] = 1
+            x_frob = self._pow_by_squaring(x, self._p)
+
+            matrix = np.zeros((self._n, self._n), dtype=self._dtype)
+            matrix[0, 0] = 1
+            for j in range(1, self._n):
+                matrix[j] = self.mul_vectors(matrix[j - 1], x_frob)
+        matrix.setflags(write=False)
+        return matrix
+
+    def pow_vectors(self, a: np.ndarray, e: int) -> np.ndarray:
+        """
+        Computes a^e (e >= 0) on coefficient vectors (an (..., n) array of
+        vectors is raised element-wise). Exponents of at least q are
+        reduced modulo q-1 first (a^q = a for every a).
+        Powers run in the compiled kernels for e < 2^63. Otherwise e is
+        written in base p when that takes fewer products than squaring
+        (see '_pow_frobenius') - e.g. for large p.
+        """
+        a = self.vectors(a)
+        if e >= self.order:
+            e = (e - 1) % (self.order - 1) + 1
+        if self._use_kernels and e < 2**63:
+            if a.ndim == 1:
+                return kernels.power(a, e, self._reduction_table, self._p)
+            return kernels.power_batch(
+                a.reshape(-1, self._n), e, self._reduction_table, self._p
+            ).reshape(a.shape)
+
+        if e >= self._p:
+            digits = []
+            rest = e
+            while rest:
+                rest, digit = divmod(rest, self._p)
+                digits.append(digit)
+            masks = _straus_masks(digits)
+            # squaring takes a product per bit of e, and one per set bit
+            if _straus_cost(digits, masks) < e.bit_length() + bin(e).count("1") - 2:
+                return self._pow_frobenius(a, digits, masks)
+        return self._pow_by_squaring(a, e)
+
+    def _pow_by_squaring(self, a: np.ndarray, e: int) -> np.ndarray:
+        result = np.zeros(np.shape(a), dtype=self._dtype)
+        result[..., 0] = 1
+        while e:
+            if e & 1:
+                result = self.mul_vectors(result, a)
+            a = self.mul_vectors(a, a)
+            e >>= 1
+        return result
+
+    def _pow_frobenius(
+        self,
+        a: np.ndarray,
+        digits: List[int],
+        masks: List[List[int]]
+    ) -> np.ndarray:
+        """
+        a^e = prod_j (a^(p^j))^(d_j) for e = sum_j d_j * p^j. The images
+        a^(p^j) are linear maps (no products), and their powers are combined
+        with Straus' simultaneous exponentiation: every bit of p costs one
+        squaring, plus one product per group of FROBENIUS_POW_WINDOW images
+        (looked up in the products of every subset of the group). That is
+        about log2(p) squarings instead of log2(e).
+        """
+        window = consts.FROBENIUS_POW_WINDOW
+        tables = []
+        for start in range(0, len(digits), window):
+            images = [
+                self.frobenius(a, j)
+                for j in range(start, min(start + window, len(digits)))
+            ]
+            # table[m] = product of images[i] for the bits i of m
+            table = [None]
+            for mask in range(1, 2**len(images)):
+                low = mask & -mask
+                table.append(
+                    images[low.bit_length() - 1] if mask == low
+                    else self.mul_vectors(table[mask ^ low], table[low])
+                )
+            tables.append(table)
+
+        result = None
+        for bit_masks in masks:
+            if result is not None:
+                result = self.mul_vectors(result, result)
+            for table, mask in zip(tables, bit_masks):
+                if mask:
+                    result = (
+                        table[mask] if result is None
+                        else self.mul_vectors(result, table[mask])
                     )
+        return result
+
+    def reduce(self, c: np.ndarray) -> np.ndarray:
+        """
+        Reduces polynomials of degree <= 2n-2 (integer arrays of shape
+        (..., 2n-1), coefficients mod p) modulo f(x).
+        """
+        if self._use_kernels and np.ndim(c) == 1:
+            return kernels.reduce(
+                self.vectors(c), self._reduction_table, self._p
+            )
+        c = self.vectors(c)
+        if self._n == 1:
+            return c % self._p
+        low, high = c[..., :self._n], c[..., self._n:]
+        return (low % self._p + self.dot(high, self._reduction_table)) % self._p
+
+    def _validate_prime(self) -> None:
+        """Checks that p is a prime (F_p is not a field otherwise)"""
+        if not factor_helper.is_prime(self._p):
+            raise ValueError(f"p is not a prime! p: {self._p}")
+
+    def _validate_irreducible(self) -> None:
+        """Checks that f(x) is indeed irreducible (for every degree)"""
+        reason = _reducibility_reason(
+            self._p, tuple(int(c) for c in self._monic_fx)
+        )
+        if reason is not None:
+            raise ValueError(f"fx is reducible! degree: {self._n}, {reason}")
+
+    def _build_reduction_table(self) -> np.ndarray:
+        """
+        Computes x^n, x^(n+1), ..., x^(2n-2) mod f(x).
+        x^n = -(f0 + f1*x + ... + f_{n-1}*x^(n-1)) for a monic f(x), and
+        every next power is the previous one times x, reduced again.
+        """
+        table = np.zeros((max(self._n - 1, 0), self._n), dtype=self._dtype)
+        if self._n > 1:
+            table[0] = -self._monic_fx[:-1] % self._p
+        for i in range(1, self._n - 1):
+            # multiply by x: shift up, and fold the x^n coefficient back
+            table[i, 1:] = table[i - 1, :-1]
+            table[i] = (
+                table[i] + self._mul_mod(table[i - 1, -1], table[0])
+            ) % self._p
+        return table
 
     def embedding_GLn(self):
         """
@@ -66,16 +565,69 @@ class FiniteField:
         representative polynomial a = [a0,a1,...,an-1] which is
         isomorphic to the multiplicative group l^x
         """
-        xn = -1*self._fx[:-1] % self._p  
-        list_of_matrices = np.zeros((self._n, self._n, self._n))
-        list_of_matrices[0, :, :] = np.identity(self._n)
+        xn = -1*self._monic_fx[:-1] % self._p  
+        # integer matrices - float products would lose precision for large p
+        list_of_matrices = np.zeros((self._n, self._n, self._n), dtype=self._dtype)
+        list_of_matrices[0, :, :] = np.identity(self._n, dtype=self._dtype)
 
         for matrix_idx in range(1, self._n):
             list_of_matrices[matrix_idx, :-1, :] = list_of_matrices[matrix_idx-1, 1:, :]   
             
             list_of_matrices[matrix_idx, -1, :]  = (
                 np.concatenate((np.array([0]), list_of_matrices[matrix_idx, -2, :-1])) +
-                list_of_matrices[matrix_idx,-2,-1]*xn
+                self._mul_mod(list_of_matrices[matrix_idx,-2,-1], xn)
             ) % self._p
 
         return list_of_matrices
+
+
+def _straus_masks(digits: List[int]) -> List[List[int]]:
+    """
+    For every bit of the digits (most significant first), the masks of the
+    digits that have it set - one mask per group of FROBENIUS_POW_WINDOW
+    digits.
+    """
+    window = consts.FROBENIUS_POW_WINDOW
+    return [
+        [
+            sum(
+                ((digits[j] >> bit) & 1) << (j - start)
+                for j in range(start, min(start + window, len(digits)))
+            )
+            for start in range(0, len(digits), window)
+        ]
+        for bit in reversed(range(max(digits).bit_length()))
+    ]
+
+
+def _straus_cost(digits: List[int], masks: List[List[int]]) -> int:
+    """
+    Number of products of '_pow_frobenius' - the Frobenius maps, the
+    subset tables, and the squarings and products of the masks.
+    """
+    window = consts.FROBENIUS_POW_WINDOW
+    groups = [
+        min(window, len(digits) - start)
+        for start in range(0, len(digits), window)
+    ]
+    return (
+        len(digits) - 1 + sum(2**g - g - 1 for g in groups) +
+        len(masks) - 1 + sum(mask != 0 for row in masks for mask in row) - 1
+    )
+
+
+@lru_cache(maxsize=None)
+def _reducibility_reason(p: int, monic_fx: Tuple[int, ...]) -> Optional[str]:
+    """
+    Runs Rabin's irreducibility test on a monic f(x), cached per (p, f(x)).
+    Returns None for an irreducible f(x), otherwise a description of a
+    factor - the smallest root if f(x) has one, or the smallest degree of
+    an irreducible factor.
+    """
+    fx = np.array(monic_fx, dtype=poly_helper.coefficient_dtype(p))
+    if poly_helper.is_irreducible(fx, p):
+        return None
+    root = poly_helper.find_root(fx, p)
+    if root is not None:
+        return f"root: {root}"
+    return f"factor degree: {poly_helper.smallest_factor_degree(fx, p)}"
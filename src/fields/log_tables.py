@@ -0,0 +1,138 @@
+import numpy as np
+import math
+
+
+class LogTables:
+    """
+    Discrete log (Zech) tables of a small finite field.
+
+    Field elements are identified by their integer code
+    a0 + a1*p + ... + a_{n-1}*p^(n-1), and the tables map between codes
+    and exponents of a fixed generator g of the multiplicative group:
+    - exp_table[k] = code of g^k, for 0 <= k < q-1
+    - log_table[code] = k such that g^k has this code (-1 for zero)
+
+    With the tables, division and inversion are reduced to integer
+    additions mod q-1 and two lookups, and the multiplicative order of an
+    element to a gcd with its log.
+
+    Attributes:
+        exp_table (np.ndarray): Codes of g^0, g^1, ..., g^(q-2).
+        log_table (np.ndarray): Discrete logs of all codes (by code).
+        generator_code (int): Code of the generator the tables are based on.
+    """
+    def __init__(
+        self,
+        exp_table: np.ndarray,
+        log_table: np.ndarray,
+        generator_code: int
+    ) -> None:
+        self._exp_table = exp_table
+        self._log_table = log_table
+        self._generator_code = generator_code
+        # order of the multiplicative group
+        self._group_order = len(exp_table)
+
+    @property
+    def exp_table(self) -> np.ndarray:
+        return self._exp_table
+
+    @property
+    def log_table(self) -> np.ndarray:
+        return self._log_table
+
+    @property
+    def generator_code(self) -> int:
+        return self._generator_code
+
+    @staticmethod
+    def nbytes(order: int) -> int:
+        """Returns the memory the tables of a field of this order need."""
+        return 2 * order * LogTables.dtype(order).itemsize
+
+    @staticmethod
+    def dtype(order: int) -> np.dtype:
+        return np.dtype(np.int32 if order < 2**31 else np.int64)
+
+    def div(self, code1: int, code2: int) -> int:
+        if code2 == 0:
+            raise ZeroDivisionError("tried to divide by the zero element")
+        if code1 == 0:
+            return 0
+        k = int(self._log_table[code1]) - int(self._log_table[code2])
+        return int(self._exp_table[k % self._group_order])
+
+    def inv(self, code: int) -> int:
+        if code == 0:
+            raise ValueError("tried to invert the zero element")
+        k = -int(self._log_table[code])
+        return int(self._exp_table[k % self._group_order])
+
+    def mul_order(self, code: int) -> int:
+        """Returns the multiplicative order of a (non-zero) element."""
+        k = int(self._log_table[code])
+        return self._group_order // math.gcd(k, self._group_order)
+
+    @classmethod
+    def build(cls, field: "FiniteField") -> "LogTables":
+        """
+        Builds the tables of a 'FiniteField'.
+
+        Candidates are tried by increasing code, and skipped when
+        g^((q-1)/r) = 1 for a prime factor r of q-1 (so they are not
+        generators). For the first remaining one, the powers are generated
+        block by block - a block of sqrt(q) consecutive powers is
+        multiplied by g^block in one vectorized product.
+        A candidate is still rejected as soon as one of its powers (other
+        than g^0) is 1.
+        Raises ValueError if f(x) turns out not to define a field.
+        """
+        order = field.order
+        group_order = order - 1
+        dtype = cls.dtype(order)
+        powers = field.code_powers
+        block_size = int(np.sqrt(group_order)) + 1
+
+        identity = field.decode(1)
+        for candidate in range(2, order):
+            g = field.decode(candidate)
+            if any(
+                np.array_equal(field.pow_vectors(g, group_order // r), identity)
+                for r in field.order_factors
+            ):
+                continue
+            # first block: g^0, g^1, ..., g^(block_size-1)
+            block = np.zeros((block_size, field.n), dtype=np.int64)
+            block[0, 0] = 1
+            for k in range(1, block_size):
+                block[k] = field.mul_vectors(block[k - 1], g)
+            # g^block_size, used to jump from block to block
+            step = field.mul_vectors(block[-1], g)
+
+            exp_table = np.empty(group_order, dtype=dtype)
+            is_generator = True
+            for start in range(0, group_order, block_size):
+                codes = block @ powers
+                stop = min(start + block_size, group_order)
+                codes = codes[:stop - start]
+                # g^k = 1 for 0 < k < q-1 means g is not a generator
+                ones = np.flatnonzero(codes == 1)
+                if len(ones) > 1 or (len(ones) == 1 and start + ones[0] != 0):
+                    is_generator = False
+                    break
+                exp_table[start:stop] = codes
+                block = field.mul_vectors(block, step)
+
+            if is_generator:
+                log_table = np.full(order, -1, dtype=dtype)
+                log_table[exp_table] = np.arange(group_order, dtype=dtype)
+                # in a field, a candidate that never returns to 1 before
+                # q-1 powers is a generator and its powers cover all
+                # non-zero elements - otherwise f(x) does not define a field
+                if np.count_nonzero(log_table == -1) != 1:
+                    raise ValueError(
+                        f"elements of order {order} do not form a field"
+                    )
+                return cls(exp_table, log_table, candidate)
+
+        raise ValueError(f"failed to find a generator for order {order}")
@@ -0,0 +1,104 @@
+from functools import lru_cache
+from typing import Dict
+
+import math
+import random
+
+
+# deterministic Miller-Rabin bases for every n < 3.3 * 10^24
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+# primes below this bound are found by trial division before Pollard rho
+TRIAL_DIVISION_BOUND = 1000
+
+
+def is_prime(n: int) -> bool:
+    """
+    Miller-Rabin primality test with fixed bases (deterministic for
+    n < 3.3 * 10^24, a strong probable prime test above that).
+    """
+    if n < 2:
+        return False
+    for base in MILLER_RABIN_BASES:
+        if n % base == 0:
+            return n == base
+
+    # n-1 = d * 2^s with d odd
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for base in MILLER_RABIN_BASES:
+        x = pow(base, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def factorize(n: int) -> Dict[int, int]:
+    """
+    Returns the prime factorization of n > 0 as {prime: exponent}.
+    Small factors are removed by trial division and the rest is split
+    with Pollard's rho (Brent's variant). Results are cached, so the
+    factorization of a group order is computed once per field.
+    """
+    factors = {}
+    for prime in range(2, TRIAL_DIVISION_BOUND):
+        if prime * prime > n:
+            break
+        while n % prime == 0:
+            factors[prime] = factors.get(prime, 0) + 1
+            n //= prime
+
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if is_prime(m):
+            factors[m] = factors.get(m, 0) + 1
+            continue
+        divisor = _pollard_brent(m)
+        stack.extend([divisor, m // divisor])
+
+    return dict(sorted(factors.items()))
+
+
+def _pollard_brent(n: int) -> int:
+    """Returns a non-trivial divisor of a composite n (Brent's rho)."""
+    if n % 2 == 0:
+        return 2
+
+    rng = random.Random(n)
+    while True:
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g, r, q = 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                # gcds are taken on products of m differences at once
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+
+        if g == n:
+            # the batch overshot - backtrack one step at a time
+            while True:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+                if g > 1:
+                    break
+        if g != n:
+            return g
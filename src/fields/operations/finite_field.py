@@ -2,26 +2,63 @@ from src.field_elements import FiniteFieldElement
 from src.fields import FiniteField
 
 import common.log.logging_handler as log
+import common.consts as consts
+
+from typing import Iterator, Optional
 
-from itertools import product
 import numpy as np
+import random
+
 
+def find_generator(
+    field: FiniteField,
+    seed: Optional[int] = None
+) -> Optional[FiniteFieldElement]:
+    """
+    Finds a generator (primitive element) of the multiplicative group of
+    the field. A non-zero g is a generator iff g^((q-1)/r) != 1 for every
+    prime r dividing q-1 = p^n - 1 (the field's cached factorization), so
+    each candidate costs a few exponentiations instead of an order search.
 
-def find_generator(field: FiniteField):
-    # create an array of field elements, ranging from 0 to p-1
-    field_elements = np.arange(field.p)
-    # create a list of n copies of the field elements for generating vectors of length n
-    field_elements_n = [field_elements for _ in range(field.n)]
-    # generate all possible combinations (vectors) of elements in the field, except the zero vector
-    vectors = list(product(*field_elements_n))[1:]
+    Candidates are sampled at random (reproducibly when a seed is given).
+    The generators are a phi(q-1)/(q-1) = Omega(1/log log q) fraction of
+    the group, so the expected number of candidates tested is
+    O(log log q). Small fields without a seed are scanned in lexicographic
+    order instead, which returns the same generator as the original
+    exhaustive search.
+    """
+    # elements handed out must share the interned field instance
+    field = FiniteField.get(field.p, field.fx.tolist())
+    group_order = field.order - 1
+    exponents = [group_order // prime for prime in field.order_factors]
+    identity = np.zeros(field.n, dtype=field.dtype)
+    identity[0] = 1
 
-    for vector in vectors:
-        finite_field_element = FiniteFieldElement(vector, field.p, field.fx)
-        order = finite_field_element.mul_order()
-        if order is not None and order == field.p**field.n - 1:
-            return finite_field_element
+    for vector in _generator_candidates(field, seed):
+        if all(
+            not np.array_equal(field.pow_vectors(vector, exp), identity)
+            for exp in exponents
+        ):
+            return FiniteFieldElement._from_field(vector, field)
 
     log.error(
         "failed to find generator for field: " +
         f"p = {field.p} | fx = {field.fx}"
     )
+
+
+def _generator_candidates(
+    field: FiniteField,
+    seed: Optional[int]
+) -> Iterator[np.ndarray]:
+    """Yields the non-zero elements of the field as coefficient vectors."""
+    if seed is None and field.order <= consts.GENERATOR_SCAN_MAX_ORDER:
+        # lexicographic order of (a0, ..., a_{n-1}) - the base-p digits of
+        # k = 1, 2, ..., q-1 with a0 as the most significant digit
+        for k in range(1, field.order):
+            yield field.decode(k)[::-1]
+        return
+
+    rng = random.Random(seed)
+    for _ in range(field.order - 1):
+        yield field.decode(rng.randrange(1, field.order))
@@ -0,0 +1,322 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# kernels of the field arithmetic on int64 coefficient vectors, compiled
+# with numba (nogil, cached on disk). 'FiniteField' uses them for primes
+# below INT64_SAFE_MODULUS, and keeps its NumPy arithmetic when numba is not
+# installed. Products of residues are exact for every such prime - above
+# INT64_SAFE_MUL_MODULUS they are split into 31-bit limbs (see '_mulmod').
+NUMBA_AVAILABLE = njit is not None
+# residues below 2^31 multiply without overflowing int64
+_LIMB_BITS = 31
+_LIMB_MASK = (1 << _LIMB_BITS) - 1
+
+
+def _kernel(function):
+    """Compiles 'function' with numba, when it is installed."""
+    if njit is None:
+        return function
+    return njit(nogil=True, cache=True)(function)
+
+
+@_kernel
+def reduce(c: np.ndarray, table: np.ndarray, p: int) -> np.ndarray:
+    """
+    Reduces a polynomial of degree <= 2n-2 (coefficients mod p) modulo
+    f(x), where table[i] = x^(n+i) mod f(x).
+    """
+    result = np.empty(table.shape[1], dtype=np.int64)
+    _reduce_into(c, table, p, result)
+    return result
+
+
+@_kernel
+def mul(a: np.ndarray, b: np.ndarray, table: np.ndarray, p: int) -> np.ndarray:
+    """Multiplies two coefficient vectors (schoolbook product, then reduce)."""
+    n = a.shape[0]
+    result = np.empty(n, dtype=np.int64)
+    _mul_into(a, b, table, p, np.empty(2*n - 1, dtype=np.int64), result)
+    return result
+
+
+@_kernel
+def mul_to(
+    a: np.ndarray,
+    b: np.ndarray,
+    table: np.ndarray,
+    p: int,
+    out: np.ndarray
+) -> None:
+    """Multiplies two coefficient vectors into 'out' (which may alias them)."""
+    _mul_into(a, b, table, p, np.empty(2*a.shape[0] - 1, dtype=np.int64), out)
+
+
+@_kernel
+def mul_batch(
+    a: np.ndarray,
+    b: np.ndarray,
+    table: np.ndarray,
+    p: int
+) -> np.ndarray:
+    """Multiplies the rows of two (m, n) arrays of coefficient vectors."""
+    result = np.empty(a.shape, dtype=np.int64)
+    product = np.empty(2*a.shape[1] - 1, dtype=np.int64)
+    for row in range(a.shape[0]):
+        _mul_into(a[row], b[row], table, p, product, result[row])
+    return result
+
+
+@_kernel
+def power(a: np.ndarray, e: int, table: np.ndarray, p: int) -> np.ndarray:
+    """Computes a^e (0 <= e < 2^63) by squaring."""
+    result = np.empty(a.shape[0], dtype=np.int64)
+    _power_into(a, e, table, p, np.empty(2*a.shape[0] - 1, dtype=np.int64), result)
+    return result
+
+
+@_kernel
+def power_batch(a: np.ndarray, e: int, table: np.ndarray, p: int) -> np.ndarray:
+    """Raises every row of an (m, n) array of coefficient vectors to e."""
+    result = np.empty(a.shape, dtype=np.int64)
+    product = np.empty(2*a.shape[1] - 1, dtype=np.int64)
+    for row in range(a.shape[0]):
+        _power_into(a[row], e, table, p, product, result[row])
+    return result
+
+
+@_kernel
+def inverse(a: np.ndarray, f: np.ndarray, p: int) -> np.ndarray:
+    """
+    Inverts a non-zero coefficient vector modulo the monic f(x), with the
+    extended Euclidean algorithm. Returns zeros if a is not invertible.
+    """
+    result = np.empty(f.shape[0] - 1, dtype=np.int64)
+    _inverse_into(a, f, p, result)
+    return result
+
+
+@_kernel
+def inverse_batch(a: np.ndarray, f: np.ndarray, p: int) -> np.ndarray:
+    """Inverts every row of an (m, n) array of coefficient vectors."""
+    result = np.empty(a.shape, dtype=np.int64)
+    for row in range(a.shape[0]):
+        _inverse_into(a[row], f, p, result[row])
+    return result
+
+
+# the '_into' kernels write to preallocated buffers, so the loops above
+# allocate nothing per multiplication. 'out' may alias the inputs - they
+# are read in full before it is written.
+@_kernel
+def _reduce_into(
+    c: np.ndarray,
+    table: np.ndarray,
+    p: int,
+    out: np.ndarray
+) -> None:
+    n = table.shape[1]
+    lazy = _lazy(n, p)
+    for k in range(n):
+        out[k] = c[k] % p
+    for i in range(c.shape[0] - n):
+        c_i = c[n + i] % p
+        if c_i != 0:
+            for k in range(n):
+                if lazy:
+                    out[k] += c_i * table[i, k]
+                else:
+                    out[k] = (out[k] + _mulmod(c_i, table[i, k], p)) % p
+    if lazy:
+        for k in range(n):
+            out[k] %= p
+
+
+@_kernel
+def _mul_into(
+    a: np.ndarray,
+    b: np.ndarray,
+    table: np.ndarray,
+    p: int,
+    product: np.ndarray,
+    out: np.ndarray
+) -> None:
+    n = a.shape[0]
+    lazy = _lazy(n, p)
+    product[:] = 0
+    for i in range(n):
+        a_i = _residue(a[i], p)
+        if a_i != 0:
+            for j in range(n):
+                if lazy:
+                    product[i + j] += a_i * _residue(b[j], p)
+                else:
+                    product[i + j] = (
+                        product[i + j] + _mulmod(a_i, _residue(b[j], p), p)
+                    ) % p
+    _reduce_into(product, table, p, out)
+
+
+@_kernel
+def _lazy(n: int, p: int) -> bool:
+    """
+    Whether sums of n products of residues fit in int64 - the reduction
+    mod p is then done once per coefficient instead of once per product.
+    """
+    return p <= 2**_LIMB_BITS and (p - 1) * (p - 1) <= (2**63 - 1) // (n + 1)
+
+
+@_kernel
+def _mulmod(a: int, b: int, p: int) -> int:
+    """
+    a*b mod p for residues a, b < p < 2^62. Above 2^31 the product would
+    overflow int64, so it is computed on 31-bit limbs a = a1*2^31 + a0,
+    b = b1*2^31 + b0 (every partial product is below 2^62):
+        a*b = ((a1*b1)*2^31 + a1*b0 + a0*b1)*2^31 + a0*b0
+    """
+    if p <= 2**_LIMB_BITS:
+        return a * b % p
+    a1, a0 = a >> _LIMB_BITS, a & _LIMB_MASK
+    b1, b0 = b >> _LIMB_BITS, b & _LIMB_MASK
+    r = _shift_limb(a1 * b1 % p, p)
+    r = (r + a1 * b0 % p) % p
+    r = (r + a0 * b1 % p) % p
+    r = _shift_limb(r, p)
+    return (r + a0 * b0 % p) % p
+
+
+@_kernel
+def _shift_limb(x: int, p: int) -> int:
+    """x * 2^31 mod p for x < p < 2^62, by doubling (2x < 2^63)."""
+    for _ in range(_LIMB_BITS):
+        x <<= 1
+        if x >= p:
+            x -= p
+    return x
+
+
+@_kernel
+def _residue(x: int, p: int) -> int:
+    """x mod p - skips the division for values that are already reduced."""
+    if 0 <= x < p:
+        return x
+    return x % p
+
+
+@_kernel
+def _power_into(
+    a: np.ndarray,
+    e: int,
+    table: np.ndarray,
+    p: int,
+    product: np.ndarray,
+    out: np.ndarray
+) -> None:
+    base = a % p
+    out[:] = 0
+    out[0] = 1
+    while e > 0:
+        if e & 1:
+            _mul_into(out, base, table, p, product, out)
+        _mul_into(base, base, table, p, product, base)
+        e >>= 1
+
+
+@_kernel
+def _inverse_into(
+    a: np.ndarray,
+    f: np.ndarray,
+    p: int,
+    out: np.ndarray
+) -> None:
+    """
+    Keeps remainders r_i ≡ s_i*a (mod f), starting from r_0 = f, s_0 = 0
+    and r_1 = a, s_1 = 1, until r_1 is a non-zero constant c - then
+    a^(-1) = s_1 / c. Every s_i has degree < n, so all the polynomials
+    fit in n+1 coefficients.
+    """
+    n = f.shape[0] - 1
+    r0 = np.zeros(n + 1, dtype=np.int64)
+    r1 = np.zeros(n + 1, dtype=np.int64)
+    s0 = np.zeros(n + 1, dtype=np.int64)
+    s1 = np.zeros(n + 1, dtype=np.int64)
+    for i in range(n + 1):
+        r0[i] = _residue(f[i], p)
+    for i in range(n):
+        r1[i] = _residue(a[i], p)
+    s1[0] = 1
+    d0, d1 = _degree(r0, n), _degree(r1, n - 1)
+    out[:] = 0
+    if d1 < 0:
+        return
+
+    while d1 > 0:
+        # long division of r_0 by r_1 - r_0 becomes the remainder, and
+        # s_0 is updated with the same multiples of s_1
+        lead_inv = _inverse_mod(r1[d1], p)
+        while d0 >= d1:
+            c = _mulmod(r0[d0], lead_inv, p)
+            k = d0 - d1
+            for i in range(d1 + 1):
+                r0[i + k] = _submod(r0[i + k], _mulmod(c, r1[i], p), p)
+            for i in range(n + 1 - k):
+                s0[i + k] = _submod(s0[i + k], _mulmod(c, s1[i], p), p)
+            d0 = _degree(r0, d0 - 1)
+        # r_1 divides r_0 - gcd(a, f) = r_1 is not a constant
+        if d0 < 0:
+            return
+        r0, r1 = r1, r0
+        s0, s1 = s1, s0
+        d0, d1 = d1, d0
+
+    c_inv = _inverse_mod(r1[0], p)
+    for i in range(n):
+        out[i] = _mulmod(s1[i], c_inv, p)
+
+
+@_kernel
+def _degree(c: np.ndarray, start: int) -> int:
+    """The degree of c, whose coefficients above 'start' are 0 (-1 for 0)."""
+    d = start
+    while d >= 0 and c[d] == 0:
+        d -= 1
+    return d
+
+
+@_kernel
+def _submod(x: int, y: int, p: int) -> int:
+    """x - y mod p for residues x, y."""
+    d = x - y
+    return d + p if d < 0 else d
+
+
+@_kernel
+def _inverse_mod(x: int, p: int) -> int:
+    """x^(-1) mod p for a non-zero residue x (extended Euclid on ints)."""
+    old_r, r = x, p
+    old_s, s = 1, 0
+    while r != 0:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_s, s = s, old_s - q * s
+    return old_s % p
+
+
+@_kernel
+def embed(a: np.ndarray, span: np.ndarray, p: int) -> np.ndarray:
+    """The GL_n image of a: sum(a_i * span[i]) mod p."""
+    n = span.shape[1]
+    result = np.zeros((n, n), dtype=np.int64)
+    for i in range(a.shape[0]):
+        a_i = _residue(a[i], p)
+        if a_i != 0:
+            for row in range(n):
+                for col in range(n):
+                    result[row, col] = (
+                        result[row, col] + _mulmod(a_i, span[i, row, col], p)
+                    ) % p
+    return result
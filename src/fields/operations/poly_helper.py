@@ -0,0 +1,210 @@
+from src.fields.operations import factor_helper
+import common.consts as consts
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+import random
+
+
+# Polynomials over F_p are integer arrays of coefficients, ordered from the
+# constant term up (a0, a1, ..., an), like the field elements and f(x).
+# Coefficients are int64 while they fit (see 'coefficient_dtype'), and
+# python ints (object arrays) for larger primes.
+
+
+def coefficient_dtype(p: int) -> np.dtype:
+    """The dtype of coefficients mod p: int64 below INT64_SAFE_MODULUS."""
+    return np.dtype(np.int64 if p < consts.INT64_SAFE_MODULUS else object)
+
+
+def scale(a: np.ndarray, c: int, p: int) -> np.ndarray:
+    """c*a mod p - exact also when c*a_i would overflow int64."""
+    if p <= consts.INT64_SAFE_MUL_MODULUS:
+        return a * c % p
+    return (a.astype(object) * c % p).astype(coefficient_dtype(p))
+
+
+def trim(a: np.ndarray) -> np.ndarray:
+    """Removes the zero high degree coefficients (the zero polynomial is [])."""
+    nonzero = np.flatnonzero(a)
+    return a[:nonzero[-1] + 1] if len(nonzero) else a[:0]
+
+
+def degree(a: np.ndarray) -> int:
+    """Returns the degree of a polynomial (-1 for the zero polynomial)."""
+    return len(trim(a)) - 1
+
+
+def poly_sub(a: np.ndarray, b: np.ndarray, p: int) -> np.ndarray:
+    length = max(len(a), len(b))
+    result = np.zeros(length, dtype=coefficient_dtype(p))
+    result[:len(a)] += a
+    result[:len(b)] -= b
+    return trim(result % p)
+
+
+def poly_mul(a: np.ndarray, b: np.ndarray, p: int) -> np.ndarray:
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros(0, dtype=coefficient_dtype(p))
+    if min(len(a), len(b)) * (p - 1)**2 < 2**63:
+        return trim(np.convolve(a, b) % p)
+    # the coefficient sums would overflow int64 - use python ints
+    product = np.convolve(a.astype(object), b.astype(object)) % p
+    return trim(product.astype(coefficient_dtype(p)))
+
+
+def poly_divmod(
+    a: np.ndarray,
+    b: np.ndarray,
+    p: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Long division of polynomials over F_p.
+    Returns (q, r) such that a = q*b + r and deg(r) < deg(b).
+    """
+    a, b = trim(a % p), trim(b % p)
+    if len(b) == 0:
+        raise ZeroDivisionError("polynomial division by zero")
+
+    dtype = coefficient_dtype(p)
+    remainder = a.astype(dtype)
+    quotient = np.zeros(max(len(a) - len(b) + 1, 0), dtype=dtype)
+    lead_inv = pow(int(b[-1]), -1, p)
+    # eliminate the leading coefficient of the remainder, one degree at a time
+    for shift in range(len(a) - len(b), -1, -1):
+        coef = int(remainder[shift + len(b) - 1]) * lead_inv % p
+        if coef:
+            quotient[shift] = coef
+            remainder[shift:shift + len(b)] = (
+                remainder[shift:shift + len(b)] - scale(b, coef, p)
+            ) % p
+    return trim(quotient), trim(remainder[:max(len(b) - 1, 0)])
+
+
+def poly_inverse(a: np.ndarray, f: np.ndarray, p: int) -> np.ndarray:
+    """
+    Computes the inverse of a modulo f over F_p using the extended
+    Euclidean algorithm, returned as deg(f) coefficients.
+    Keeps remainders r_i = s_i*a (mod f), until the remainder is a
+    non-zero constant c - then a^(-1) = s_i / c.
+    """
+    n = len(trim(f)) - 1
+    old_r, r = trim(f % p), trim(a % p)
+    dtype = coefficient_dtype(p)
+    old_s, s = np.zeros(0, dtype=dtype), np.ones(1, dtype=dtype)
+
+    if len(r) == 0:
+        raise ValueError("tried to invert the zero element")
+
+    while len(r) > 0:
+        q, remainder = poly_divmod(old_r, r, p)
+        old_r, r = r, remainder
+        old_s, s = s, poly_sub(old_s, poly_mul(q, s, p), p)
+
+    # old_r is gcd(a, f) - a is invertible only if it is a constant
+    if len(old_r) != 1:
+        raise ValueError("element is not invertible modulo f(x)")
+
+    inverse = scale(old_s, pow(int(old_r[0]), -1, p), p)
+    result = np.zeros(n, dtype=dtype)
+    result[:len(inverse)] = inverse
+    return result
+
+
+def poly_gcd(a: np.ndarray, b: np.ndarray, p: int) -> np.ndarray:
+    """Returns the monic gcd of a and b over F_p (Euclidean algorithm)."""
+    a, b = trim(a % p), trim(b % p)
+    while len(b) > 0:
+        a, b = b, poly_divmod(a, b, p)[1]
+    if len(a) == 0:
+        return a
+    return scale(a, pow(int(a[-1]), -1, p), p)
+
+
+def poly_powmod(a: np.ndarray, e: int, f: np.ndarray, p: int) -> np.ndarray:
+    """Computes a^e mod f over F_p by repeated squaring."""
+    result = poly_divmod(np.ones(1, dtype=coefficient_dtype(p)), f, p)[1]
+    base = poly_divmod(a, f, p)[1]
+    while e > 0:
+        if e & 1:
+            result = poly_divmod(poly_mul(result, base, p), f, p)[1]
+        base = poly_divmod(poly_mul(base, base, p), f, p)[1]
+        e >>= 1
+    return result
+
+
+def is_irreducible(f: np.ndarray, p: int) -> bool:
+    """
+    Rabin's irreducibility test for a polynomial f of degree n over F_p.
+    f is irreducible iff x^(p^n) = x (mod f), and gcd(f, x^(p^(n/r)) - x) = 1
+    for every prime r dividing n. The powers x^(p^i) mod f are computed
+    one after the other, each as the p-th power of the previous one, so
+    the test takes n*log(p) polynomial multiplications mod f.
+    """
+    f = trim(f % p)
+    n = len(f) - 1
+    if n <= 1:
+        return n == 1
+
+    x = np.array([0, 1], dtype=coefficient_dtype(p))
+    checkpoints = {n // r for r in factor_helper.factorize(n)}
+    x_power = x
+    for i in range(1, n + 1):
+        x_power = poly_powmod(x_power, p, f, p)
+        if i in checkpoints and len(poly_gcd(f, poly_sub(x_power, x, p), p)) > 1:
+            return False
+    return len(poly_sub(x_power, x, p)) == 0
+
+
+def smallest_factor_degree(f: np.ndarray, p: int) -> int:
+    """
+    Returns the smallest degree of an irreducible factor of f over F_p
+    (deg(f) if f is irreducible). Ben-Or's test: f has a factor of degree i
+    iff gcd(f, x^(p^i) - x) != 1, checked for i = 1, 2, ..., deg(f)/2.
+    """
+    f = trim(f % p)
+    n = len(f) - 1
+    x = np.array([0, 1], dtype=coefficient_dtype(p))
+    x_power = x
+    for i in range(1, n // 2 + 1):
+        x_power = poly_powmod(x_power, p, f, p)
+        if len(poly_gcd(f, poly_sub(x_power, x, p), p)) > 1:
+            return i
+    return n
+
+
+def find_root(f: np.ndarray, p: int) -> Optional[int]:
+    """
+    Returns the smallest root of f in F_p (None if f has no roots).
+    The product of the linear factors of f is gcd(f, x^p - x), which is
+    split into its roots with the Cantor-Zassenhaus algorithm.
+    """
+    f = trim(f % p)
+    x = np.array([0, 1], dtype=coefficient_dtype(p))
+    linear = poly_gcd(f, poly_sub(poly_powmod(x, p, f, p), x, p), p)
+    if len(linear) <= 1:
+        return None
+    return min(_split_roots(linear, p, random.Random(p)))
+
+
+def _split_roots(g: np.ndarray, p: int, rng: random.Random) -> List[int]:
+    """Returns the roots of a monic g that is a product of distinct x - r."""
+    if len(g) == 2:
+        return [int(-g[0] % p)]
+    if p == 2:
+        # g = x(x+1)
+        return [0, 1]
+
+    while True:
+        # (x+c)^((p-1)/2) = 1 for about half of the roots r (those where
+        # r+c is a square), so the gcd below is usually a proper factor
+        c = rng.randrange(p)
+        shifted = np.array([c, 1], dtype=coefficient_dtype(p))
+        h = poly_powmod(shifted, (p - 1) // 2, g, p)
+        h = poly_gcd(g, poly_sub(h, np.ones(1, dtype=coefficient_dtype(p)), p), p)
+        if 1 < len(h) < len(g):
+            return (
+                _split_roots(h, p, rng) +
+                _split_roots(poly_divmod(g, h, p)[0], p, rng)
+            )
@@ -0,0 +1,82 @@
+from src.field_elements.operations import finite_field_element as ops
+from src.field_elements.operations.bsgs_table import BSGSTable
+from src.fields.operations.finite_field import find_generator
+from src.fields import FiniteField
+import common.consts as consts
+
+import numpy as np
+import pytest
+import os
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(consts, "BSGS_TABLE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(consts, "BSGS_TABLE_PERSIST_MIN_SIZE", 16)
+    BSGSTable._CACHE.clear()
+    yield tmp_path
+    BSGSTable._CACHE.clear()
+
+
+@pytest.fixture
+def g():
+    return find_generator(FiniteField.get(1009, [11, 1, 1]), seed=1)
+
+
+def _key(g, size):
+    field = g.field
+    return (
+        field.p, tuple(int(c) for c in field.fx), field.encode(g.a), size
+    )
+
+
+def _check_logs(g, table_size):
+    field = g.field
+    for x in (0, 1, 1000, 123456, field.order - 2):
+        h = field.pow_vectors(g.a, x)
+        assert ops.discrete_log_bsgs(h, g, table_size=table_size) == x
+
+
+def test_table_is_written_and_memory_mapped(cache_dir, g):
+    table = BSGSTable.get(g.field, g.a, 1024)
+    path = BSGSTable.path(_key(g, 1024))
+    assert os.path.exists(path)
+
+    BSGSTable._CACHE.clear()
+    loaded = BSGSTable.get(g.field, g.a, 1024)
+    assert loaded is not table
+    assert isinstance(loaded.codes, np.memmap)
+    assert np.array_equal(loaded.codes, table.codes)
+    assert np.array_equal(loaded.exponents, table.exponents)
+    _check_logs(g, 1024)
+
+
+def test_table_lookup(cache_dir, g):
+    table = BSGSTable.get(g.field, g.a, 1024)
+    exponents = np.arange(1024)
+    codes = np.array([
+        g.field.encode(g.field.pow_vectors(g.a, int(e))) for e in exponents
+    ])
+    assert np.array_equal(table.lookup(codes), exponents)
+    missing = g.field.encode(g.field.pow_vectors(g.a, 5000))
+    assert table.lookup(np.array([missing]))[0] == -1
+
+
+@pytest.mark.parametrize("content", [b"", b"not a numpy file", None])
+def test_corrupt_table_is_rebuilt(cache_dir, g, content):
+    table = BSGSTable.get(g.field, g.a, 1024)
+    path = BSGSTable.path(_key(g, 1024))
+    if content is None:
+        # a truncated table
+        with open(path, "rb") as f:
+            content = f.read()[:-100]
+    with open(path, "wb") as f:
+        f.write(content)
+
+    BSGSTable._CACHE.clear()
+    rebuilt = BSGSTable.get(g.field, g.a, 1024)
+    assert np.array_equal(rebuilt.codes, table.codes)
+    assert np.array_equal(rebuilt.exponents, table.exponents)
+    # the file was rewritten and loads again
+    assert BSGSTable.load(path, 1024) is not None
+    _check_logs(g, 1024)
@@ -0,0 +1,52 @@
+from src.field_elements.operations import finite_field_element as ops
+
+import pytest
+import random
+
+
+def _check(a, n, rng, count=10):
+    for _ in range(count):
+        x = rng.randrange(1, 10**6)
+        b = pow(a, x, n)
+        result = ops.discrete_log_mod_n(a, b, n)
+        assert result is not None and pow(a, result, n) == b
+
+
+@pytest.mark.parametrize("a, n", [
+    (3, 2**5), (5, 2**16), (7, 2**61), (2**20 - 1, 2**40)
+])
+def test_powers_of_2(a, n):
+    _check(a, n, random.Random(n))
+
+
+@pytest.mark.parametrize("a, n", [
+    (2, 3**10), (3, 5**7), (10, 7**20), (6, 101**3), (3, 1009**2)
+])
+def test_odd_prime_powers(a, n):
+    _check(a, n, random.Random(n))
+
+
+@pytest.mark.parametrize("a, n", [
+    (7, 2**10 * 3**5), (2, 3**4 * 5**3 * 7**2), (5, 2**3 * 101 * 1009**2)
+])
+def test_composite_moduli(a, n):
+    _check(a, n, random.Random(n))
+
+
+@pytest.mark.parametrize("k", [16, 40, 200])
+def test_theta_of_base_is_zero(k):
+    # a = 3^k - 1 is ≡ -1 (mod 3) and θ(a) ≡ 0 - the congruence
+    # θ(a)*x ≡ θ(b) has p^(s-1) solutions, which must not be enumerated
+    n = 3**k
+    assert ops.discrete_log_mod_n(n - 1, 1, n) == 0
+    assert ops.discrete_log_mod_n(n - 1, n - 1, n) == 1
+
+
+@pytest.mark.parametrize("a, b, n", [(3, 6, 2**10), (2, 9, 3**5), (6, 5, 3**5)])
+def test_non_units(a, b, n):
+    assert ops.discrete_log_mod_n(a, b, n) is None
+
+
+def test_not_a_power():
+    # 3 generates a proper subgroup of U_(2^5) that does not contain -1
+    assert ops.discrete_log_mod_n(3, 31, 2**5) is None
@@ -0,0 +1,43 @@
+from src.field_elements.operations import prime_field_element as ops
+from src.field_elements import PrimeFieldElement
+
+import pytest
+import random
+
+
+@pytest.mark.parametrize("p, g", [
+    # p-1 = 2 * 500000003 - relations and linear algebra
+    (10**9 + 7, 5),
+    # p-1 = 2 * 3 * 13 * 17 * 29 * 26005097
+    (10**12 + 39, 3),
+    # p-1 is smooth - Pohlig-Hellman only
+    (2**31 - 1, 7),
+])
+def test_index_calculus(p, g):
+    rng = random.Random(p)
+    generator = PrimeFieldElement(g, p)
+    for seed in range(3):
+        x = rng.randrange(p - 1)
+        h = pow(g, x, p)
+        assert ops.discrete_log_index_calculus(h, generator, seed=seed) == x
+    h = PrimeFieldElement(h, p)
+    assert ops.discrete_log_index_calculus(h, generator, seed=0) == x
+
+
+def test_index_calculus_workers():
+    p, g = 10**9 + 7, 5
+    rng = random.Random(1)
+    for seed in range(2):
+        x = rng.randrange(p - 1)
+        result = ops.discrete_log_index_calculus(
+            pow(g, x, p), PrimeFieldElement(g, p), workers=2, seed=seed
+        )
+        assert result == x
+
+
+def test_index_calculus_invalid_input():
+    p = 10**9 + 7
+    assert ops.discrete_log_index_calculus(0, PrimeFieldElement(5, p)) is None
+    # 4 is a square, not a generator
+    assert ops.discrete_log_index_calculus(3, PrimeFieldElement(4, p)) is None
+    assert ops.discrete_log_index_calculus(3, None) is None
@@ -0,0 +1,71 @@
+from src.field_elements import (
+    AbstractFieldElement,
+    FiniteFieldElement,
+    PrimeFieldElement
+)
+from src.fields.operations.finite_field import find_generator
+from src.fields import FiniteField
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def g():
+    return find_generator(FiniteField.get(5, [3, 3, 0, 1]), seed=1)
+
+
+def test_held_coefficients_survive_in_place_operations(g):
+    x = g.copy()
+    x *= g
+    saved = x.a
+    saved_orig = x.a_orig
+    expected = saved.copy()
+    x *= g
+    x += g
+    x -= g
+    assert np.array_equal(saved, expected)
+    assert np.array_equal(saved_orig, expected)
+    assert np.array_equal(x.a, g.field.pow_vectors(g.a, 3))
+
+
+def test_in_place_operations_leave_copies_unchanged(g):
+    x = g.copy()
+    y = x.copy()
+    for _ in range(5):
+        x *= x
+    assert y == g
+    assert np.array_equal(x.a, g.field.pow_vectors(g.a, 2**5))
+
+
+def test_in_place_operations_match_binary_operations(g):
+    h = g * g + g
+    x = g.copy()
+    x += h
+    assert x == g + h
+    x -= g
+    assert x == h
+    x *= h
+    assert x == h * h
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 123, -1, -7])
+def test_base_exp_by_squaring(g, n):
+    # the in-place loop of the base class, on both element types
+    x = g.copy()
+    assert AbstractFieldElement.exp_by_squaring(x, n) == g.exp_by_squaring(n)
+    assert x == g
+
+    y = PrimeFieldElement(3, 101)
+    assert AbstractFieldElement.exp_by_squaring(y, n).a == pow(3, n, 101)
+    assert y.a == 3
+
+
+def test_prime_field_in_place_operations():
+    x = PrimeFieldElement(3, 101)
+    y = x.copy()
+    x *= PrimeFieldElement(5, 101)
+    x += PrimeFieldElement(100, 101)
+    x -= PrimeFieldElement(4, 101)
+    assert x.a == (3 * 5 + 100 - 4) % 101
+    assert y.a == 3
@@ -0,0 +1,33 @@
+from src.fields import FiniteField
+
+import numpy as np
+import pytest
+import random
+
+
+@pytest.mark.parametrize("p, fx", [
+    (2, [1, 1, 0, 0, 1]),
+    (5, [3, 3, 0, 1]),
+    (1009, [11, 1, 1]),
+    (2**61 - 1, [2**61 - 4, 0, 1]),
+    # degree 8 - Itoh-Tsujii
+    (2, [1, 1, 0, 1, 1, 0, 0, 0, 1]),
+])
+def test_inv_vectors(p, fx):
+    field = FiniteField.get(p, fx)
+    rng = random.Random(p)
+    a = np.array(
+        [[rng.randrange(p) for _ in range(field.n)] for _ in range(50)],
+        dtype=field.dtype
+    )
+    a = a[np.any(a != 0, axis=-1)]
+    expected = field.pow_vectors(a, field.order - 2)
+    assert np.array_equal(field.inv_vectors(a), expected)
+    for row, inverse in zip(a, expected):
+        assert np.array_equal(field.inv_vectors(row), inverse)
+
+
+def test_inv_vectors_of_zero():
+    field = FiniteField.get(5, [3, 3, 0, 1])
+    with pytest.raises(ValueError):
+        field.inv_vectors([0, 0, 0])
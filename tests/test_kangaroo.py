@@ -0,0 +1,35 @@
+from src.field_elements.operations import finite_field_element as ops
+from src.fields.operations.finite_field import find_generator
+from src.fields import FiniteField
+
+import pytest
+import random
+
+
+@pytest.mark.parametrize("p, fx", [
+    (3, [1, 2, 0, 1]),
+    (5, [3, 3, 0, 1]),
+    (31, [2, 1, 1]),
+    (101, [2, 1, 1]),
+    (1009, [11, 1, 1]),
+])
+def test_kangaroo_default_bounds(p, fx):
+    # the default interval [0, q-2] is the whole group - the walks wrap
+    # around its order, which must not lose the log
+    field = FiniteField.get(p, fx)
+    g = find_generator(field, seed=1)
+    rng = random.Random(p)
+    for seed in range(10):
+        x = rng.randrange(field.order - 1)
+        h = field.pow_vectors(g.a, x)
+        assert ops.discrete_log_kangaroo(h, g, seed=seed) == x
+
+
+def test_kangaroo_interval():
+    field = FiniteField.get(1009, [11, 1, 1])
+    g = find_generator(field, seed=1)
+    x = 123456
+    h = field.pow_vectors(g.a, x)
+    assert ops.discrete_log_kangaroo(
+        h, g, lower=x - 5000, upper=x + 5000, seed=0
+    ) == x
@@ -0,0 +1,44 @@
+from src.field_elements.operations import finite_field_element as ops
+from src.field_elements.operations import math_helper
+from src.fields.operations.finite_field import find_generator
+from src.fields import FiniteField
+
+import pytest
+import math
+import random
+
+
+@pytest.mark.parametrize("a, b, m", [
+    (6, 4, 10), (0, 0, 12), (4, 3, 8), (7, 3, 11), (2**40, 2**41, 2**64)
+])
+def test_linear_congruence_solutions(a, b, m):
+    solutions = math_helper.linear_congruence_solutions(a, b, m)
+    expected = [x for x in range(min(m, 100)) if (a * x - b) % m == 0]
+    if solutions is None:
+        assert not expected and b % math.gcd(a, m) != 0
+        return
+    x0, step, count = solutions
+    assert count == math.gcd(a, m) and step == m // count
+    assert (a * x0 - b) % m == 0
+    small = [x0 + k * step for k in range(min(count, 100))]
+    assert [x for x in small if x < 100] == expected
+
+
+def test_degenerate_collision_is_rejected_before_enumerating():
+    # b = b' gives 0*x ≡ 0 (mod q-1) - q-1 candidates, too many to try
+    field = FiniteField.get(1009, [11, 1, 1])
+    g = find_generator(field, seed=1)
+    assert ops._solve_collision(
+        field, g.a, g.a, field.order - 1, 3, 5, 3, 5
+    ) is None
+
+
+@pytest.mark.parametrize("p, fx", [(31, [2, 1, 1]), (1009, [11, 1, 1])])
+def test_pollard_rho(p, fx):
+    field = FiniteField.get(p, fx)
+    g = find_generator(field, seed=1)
+    rng = random.Random(p)
+    for seed in range(5):
+        x = rng.randrange(field.order - 1)
+        h = field.pow_vectors(g.a, x)
+        assert ops.discrete_log_pollard_rho(h, g, seed=seed) == x